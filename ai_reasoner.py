@@ -1,6 +1,7 @@
 import os
 import requests
 import json
+from functools import lru_cache
 from typing import List, Dict
 
 # -------------------------------------------------------
@@ -16,6 +17,9 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = "gpt-4o-mini"
 
+# Failures sent together in one bundle request
+AI_BUNDLE_BATCH_SIZE = 10
+
 
 def generate_ai_summary(testcase, error_message, details):
     """
@@ -186,11 +190,97 @@ Focus on prevention and robustness."""
     return "⚠️ Test improvement suggestions require GROQ_API_KEY configuration."
 
 
+def generate_ai_bundle(failures: List[Dict], include_jira=True, include_improvements=False) -> List[Dict]:
+    """
+    🆕 NEW FEATURE: Analyze many failures with one request per batch.
+    Replaces one summary/Jira/improvements request per failure.
+    Returns one {"summary", "jira", "improvements"} dict per failure, in order,
+    or None where the AI call failed - those are left for the on-demand button.
+    """
+    
+    bundle = []
+    for start in range(0, len(failures), AI_BUNDLE_BATCH_SIZE):
+        batch = failures[start:start + AI_BUNDLE_BATCH_SIZE]
+        try:
+            bundle.extend(_generate_bundle_batch(batch, include_jira, include_improvements))
+        except ValueError as e:
+            # Unusable reply - retry this batch one failure per request
+            print(f"⚠️ AI bundle reply unusable, analyzing one by one: {e}")
+            for f in batch:
+                try:
+                    bundle.extend(_generate_bundle_batch([f], include_jira, include_improvements))
+                except Exception as e:
+                    print(f"⚠️ AI analysis failed for {f['testcase']}: {e}")
+                    bundle.append(None)
+        except Exception as e:
+            # API/transport error (rate limit, outage) - more requests won't help
+            print(f"❌ AI bundle request failed, skipping remaining failures: {e}")
+            bundle.extend([None] * (len(failures) - len(bundle)))
+            break
+    
+    return bundle
+
+
+def _generate_bundle_batch(batch: List[Dict], include_jira, include_improvements) -> List[Dict]:
+    """One bundle request - raises ValueError if the reply doesn't cover every failure"""
+    
+    failure_list = "\n\n".join(
+        f"### Failure {i}\n**Testcase:** {f['testcase']}\n**Error:** {f['error']}\n**Details:** {f['details']}"
+        for i, f in enumerate(batch, 1)
+    )
+    
+    fields = ['"summary": Root Cause, Suggested Fix, Priority (High/Medium/Low with reasoning) and Potential Impact']
+    if include_jira:
+        fields.append('"jira": ready-to-paste Jira ticket with Title, Description, Steps to Reproduce, Expected vs Actual Result, Priority & Labels and Assignee Suggestion')
+    if include_improvements:
+        fields.append('"improvements": Test Design Issues, Stability Improvements, Best Practices and Code Suggestions')
+    field_list = "\n".join(f"- {field}" for field in fields)
+    
+    prompt = f"""Analyze these {len(batch)} Provar/Salesforce test failures.
+
+{failure_list}
+
+Reply with a JSON object {{"results": [...]}} holding one object per failure, in the same order.
+Each object has these markdown string fields:
+{field_list}
+
+Keep every field concise and actionable for QA engineers."""
+
+    max_tokens = min(8000, 600 * len(fields) * len(batch))
+    if GROQ_API_KEY:
+        reply = _call_groq(prompt, max_tokens=max_tokens, json_mode=True)
+    elif OPENAI_API_KEY:
+        reply = _call_openai(prompt, max_tokens=max_tokens, json_mode=True)
+    else:
+        raise Exception("No AI service configured")
+    
+    # Bad replies raise ValueError (JSONDecodeError is one) - API errors raise from the call above
+    try:
+        results = json.loads(reply)["results"]
+    except (KeyError, TypeError):
+        raise ValueError("AI bundle reply has no results list")
+    if not isinstance(results, list) or len(results) != len(batch) or not all(isinstance(r, dict) and r.get("summary") for r in results):
+        raise ValueError(f"AI bundle did not cover all {len(batch)} failures")
+    
+    return [
+        {
+            "summary": r["summary"],
+            "jira": r.get("jira") if include_jira else None,
+            "improvements": r.get("improvements") if include_improvements else None,
+        }
+        for r in results
+    ]
+
+
 # -------------------------------------------------------
 # INTERNAL API CALLS
+# Successful replies are memoized on the prompt, so reruns and
+# re-analyzed reports don't repeat a request. Errors raise and
+# are not cached.
 # -------------------------------------------------------
 
-def _call_groq(prompt: str) -> str:
+@lru_cache(maxsize=1024)
+def _call_groq(prompt: str, max_tokens: int = 1000, json_mode: bool = False) -> str:
     """Call Groq API (FREE & FAST)"""
     
     headers = {
@@ -211,10 +301,13 @@ def _call_groq(prompt: str) -> str:
             }
         ],
         "temperature": 0.3,
-        "max_tokens": 1000
+        "max_tokens": max_tokens
     }
+    if json_mode:
+        payload["response_format"] = {"type": "json_object"}
     
-    response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=30)
+    # Bundle replies are several times longer than a single analysis
+    response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=30 + max_tokens // 100)
     
     if response.status_code == 200:
         return response.json()["choices"][0]["message"]["content"].strip()
@@ -222,7 +315,8 @@ def _call_groq(prompt: str) -> str:
         raise Exception(f"Groq API error: {response.status_code} - {response.text}")
 
 
-def _call_openai(prompt: str) -> str:
+@lru_cache(maxsize=1024)
+def _call_openai(prompt: str, max_tokens: int = 1000, json_mode: bool = False) -> str:
     """Call OpenAI API (FALLBACK)"""
     
     try:
@@ -241,8 +335,9 @@ def _call_openai(prompt: str) -> str:
                     "content": prompt
                 }
             ],
-            max_tokens=1000,
-            temperature=0.3
+            max_tokens=max_tokens,
+            temperature=0.3,
+            **({"response_format": {"type": "json_object"}} if json_mode else {})
         )
         
         return response.choices[0].message.content.strip()
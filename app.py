@@ -3,23 +3,47 @@ Provar AI - Multi-Platform XML Analyzer v4.0.0
 Modern Navigation with All Existing Features Preserved
 """
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
 import os
+import io
+import re
+import csv
+import hashlib
+from collections import defaultdict
 from datetime import datetime
+from functools import lru_cache
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
 
 # Storage and Services
 from storage.baseline_service import BaselineService
 from github_storage import GitHubStorage
 
 # Initialize GitHub and Baseline Service
-github = GitHubStorage(
-    token=st.secrets.get("GITHUB_TOKEN"),
-    repo_owner=st.secrets.get("GITHUB_OWNER"),
-    repo_name=st.secrets.get("GITHUB_REPO")
-)
+@st.cache_resource
+def get_github_storage():
+    """Create the GitHub client once per process - it survives reruns and sessions"""
+    # Read the secrets in one pass
+    secrets = {k: st.secrets.get(k) for k in ("GITHUB_TOKEN", "GITHUB_OWNER", "GITHUB_REPO")}
+    return GitHubStorage(
+        token=secrets["GITHUB_TOKEN"],
+        repo_owner=secrets["GITHUB_OWNER"],
+        repo_name=secrets["GITHUB_REPO"]
+    )
+
+@st.cache_resource
+def get_executor():
+    """Shared worker pool for background GitHub I/O"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="github-io")
+
+github = get_github_storage()
+# BaselineService keeps its cache in st.session_state, so it stays per-session (cheap to build)
 baseline_service = BaselineService(github)
 
+@st.cache_data(ttl=60, show_spinner=False)
+def github_connection_probe():
+    """GitHub connection check for the sidebar and settings - cached so reruns don't each hit the GitHub API"""
+    return len(github.list_baselines())
+
 # Import extractors
 from xml_extractor import extract_failed_tests
 from automation_api_extractor import (
@@ -30,64 +54,90 @@ from automation_api_extractor import (
 
 
 # Import baseline managers
-from baseline_manager import (
-    save_baseline,
-    load_baseline,
-    compare_with_baseline,
-    baseline_exists as legacy_baseline_exists,
-    KNOWN_PROJECTS
-)
-
-from automation_api_baseline_manager import (
-    save_baseline as save_api_baseline,
-    compare_with_baseline as compare_api_baseline,
-    load_baseline as load_api_baseline,
-    baseline_exists as api_baseline_exists
-)
-
-# Import dashboard
-from baseline_tracker_dashboard import render_baseline_tracker_dashboard
+from baseline_manager import KNOWN_PROJECTS
 
 # Multi-baseline engines (optional)
-try:
-    from baseline_engine import (
-        save_baseline as save_multi_baseline,
-        load_baseline as load_multi_baseline,
-        list_baselines,
-        get_latest_baseline,
-        compare_with_baseline as compare_multi_baseline,
-        baseline_exists as multi_baseline_exists,
-        get_baseline_stats
-    )
-    MULTI_BASELINE_AVAILABLE = True
-except ImportError:
-    MULTI_BASELINE_AVAILABLE = False
-
-try:
-    from automation_api_baseline_engine import (
-        save_baseline as save_api_baseline_multi,
-        compare_with_baseline as compare_api_baseline_multi,
-        list_baselines as list_api_baselines,
-        get_baseline_stats as get_api_baseline_stats,
-        baseline_exists as api_baseline_exists_multi,
-        get_latest_baseline as get_api_latest_baseline
-    )
-    API_MULTI_BASELINE_AVAILABLE = True
-except ImportError:
-    API_MULTI_BASELINE_AVAILABLE = False
-    # ===================================================================
-    # ===================================================================
-# HIDE GITHUB ICON - MUST BE FIRST
-# ===================================================================
-st.set_page_config(page_title="Provar Report Analyzer AI", page_icon="🎯", layout="wide")
+# Only probe for the modules here - the pages that use them import them on demand,
+# so routes like Dashboard/Settings never execute the engines (or pandas/plotly).
+MULTI_BASELINE_AVAILABLE = find_spec("baseline_engine") is not None
+API_MULTI_BASELINE_AVAILABLE = find_spec("automation_api_baseline_engine") is not None
 
-st.markdown("""
-<style>
+# ===================================================================
+# PAGE CONFIGURATION & STYLES - MUST BE FIRST
+# ===================================================================
+APP_CSS = """
+    <style>
     /* Hide only the Fork button and GitHub icon */
     .stAppDeployButton {display: none;}
     button[kind="header"]:first-child {display: none;}
-</style>
-""", unsafe_allow_html=True)
+    .main-header {
+        font-size: 2.5rem;
+        font-weight: bold;
+        color: #1f77b4;
+        text-align: center;
+        padding: 1rem 0;
+    }
+    .section-divider {
+        border-top: 2px solid #e0e0e0;
+        margin: 2rem 0;
+    }
+    .nav-button {
+        width: 100%;
+        text-align: left;
+        padding: 0.5rem 1rem;
+        margin: 0.2rem 0;
+        border-radius: 5px;
+        border: none;
+        background: transparent;
+        cursor: pointer;
+    }
+    .nav-button:hover {
+        background: #f0f2f6;
+    }
+    .nav-button-active {
+        background: #e3f2fd;
+        border-left: 4px solid #1f77b4;
+    }
+    .ai-feature-box {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 1rem;
+        border-radius: 10px;
+        color: white;
+        margin: 1rem 0;
+    }
+    .spec-group {
+        background: #f8f9fa;
+        border-left: 4px solid #667eea;
+        padding: 1rem;
+        margin: 1rem 0;
+        border-radius: 8px;
+    }
+    .real-failure {
+        border-left: 4px solid #dc3545;
+    }
+    .skipped-failure {
+        border-left: 4px solid #ffc107;
+        background: #fff9e6;
+    }
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    </style>
+"""
+
+# Static section divider - st.html skips the markdown parser
+DIVIDER_HTML = '<div class="section-divider"></div>'
+
+st.set_page_config(
+    "Provar AI - Multi-Platform XML Analyzer",
+    layout="wide",
+    page_icon="🚀",
+    initial_sidebar_state="expanded"
+)
+
+# Emitted on every run on purpose: Streamlit drops any element a rerun doesn't
+# re-emit, so a "once per session" guard would unstyle the app after the first click.
+# APP_CSS is a module constant, so this costs no string building per run.
+st.markdown(APP_CSS, unsafe_allow_html=True)
 # ===================================================================
 # PASSWORD PROTECTION
 # ===================================================================
@@ -130,44 +180,113 @@ if not check_password():
     st.stop()
 
 # ===================================================================
-# Hide GitHub icon and menu
-st.markdown("""
-<style>
-    /* Hide only the Fork button and GitHub icon */
-    .stAppDeployButton {display: none;}
-    button[kind="header"]:first-child {display: none;}
-</style>
-""", unsafe_allow_html=True)
-# ===================================================================
-# REST OF YOUR APP CONTINUES HERE
-# ===================================================================
-
-
-    # ===================================================================
 # AI modules - lazy loaded only when needed
 generate_ai_summary = None
 generate_batch_analysis = None
 generate_jira_ticket = None
 suggest_test_improvements = None
+generate_ai_bundle = None
 
 def load_ai_modules():
     """Load AI modules only when user enables AI"""
-    global generate_ai_summary, generate_batch_analysis, generate_jira_ticket, suggest_test_improvements
+    global generate_ai_summary, generate_batch_analysis, generate_jira_ticket, suggest_test_improvements, generate_ai_bundle
     
     if generate_ai_summary is None:  # Only import once
         from ai_reasoner import (
             generate_ai_summary as _gen_summary,
             generate_batch_analysis as _gen_batch,
             generate_jira_ticket as _gen_jira,
-            suggest_test_improvements as _gen_improve
+            suggest_test_improvements as _gen_improve,
+            generate_ai_bundle as _gen_bundle
         )
         generate_ai_summary = _gen_summary
         generate_batch_analysis = _gen_batch
         generate_jira_ticket = _gen_jira
         suggest_test_improvements = _gen_improve
+        generate_ai_bundle = _gen_bundle
     return True
 
+def occurrence_suffix(failure):
+    """' (×3)' for a failure that occurred several times in its report"""
+    occurrences = failure.get('occurrences', 1)
+    return f" (×{occurrences})" if occurrences > 1 else ""
+
+def occurrence_count(failures):
+    """Number of failures as reported, counting each occurrence of a deduplicated one"""
+    return sum(f.get('occurrences', 1) for f in failures)
+
+def expand_occurrences(failures):
+    """Deduplicated failures back as reported - one row per occurrence, without the
+    'occurrences' key. Baselines are saved in this shape, the same for both platforms."""
+    return [
+        {key: value for key, value in f.items() if key != 'occurrences'}
+        for f in failures
+        for _ in range(f.get('occurrences', 1))
+    ]
+
+def ai_failure_key(testcase, error, details):
+    """Key of a failure's entry in a result's 'ai_bundle'"""
+    return (testcase, error, details)
+
+def automation_failure_signature(f):
+    """Identity of an AutomationAPI failure when comparing against a baseline -
+    a fixed 16-byte digest, however long the error text"""
+    interaction = f.get("interaction", {}) or {}
+    h = hashlib.blake2b(digest_size=16)
+    for field in (
+        f.get("spec_file", ""),
+        f.get("test_name", ""),
+        f.get("error_summary", ""),
+        str(interaction.get("ActualValue", "")),
+        str(interaction.get("ExpectedValue", "")),
+    ):
+        h.update(str(field).encode("utf-8"))
+        h.update(b"\x1f")  # field separator
+    return h.digest()
+
+def unique_api_failures(failures):
+    """Retried tests repeat the same failure - one copy per signature,
+    counting how often it occurred. Returns {signature: failure}."""
+    unique = {}
+    for failure in failures:
+        sig = automation_failure_signature(failure)
+        if sig in unique:
+            unique[sig]['occurrences'] += 1
+        else:
+            unique[sig] = dict(failure, occurrences=1)
+    return unique
+
+def api_spec_groups(result):
+    """Failures of an AutomationAPI result grouped by spec (all / new / existing),
+    plus which specs are new, mixed or existing-only.
+    Built the first time the result is rendered and kept on it, so neither
+    the analyze click nor later reruns regroup."""
+    groups = result.get('spec_groups')
+    if groups is None:
+        new_by_spec = defaultdict(list)
+        existing_by_spec = defaultdict(list)
+        for failure in result['new_failures']:
+            new_by_spec[failure.get('spec_file', 'Unknown')].append(failure)
+        for failure in result['existing_failures']:
+            existing_by_spec[failure.get('spec_file', 'Unknown')].append(failure)
+        
+        # Spec classification, sorted once in display order
+        new_keys = new_by_spec.keys()
+        existing_keys = existing_by_spec.keys()
+        
+        groups = result['spec_groups'] = {
+            'all': group_failures_by_spec(result['all_failures']),
+            'new': dict(new_by_spec),
+            'existing': dict(existing_by_spec),
+            'new_specs': tuple(sorted(new_keys - existing_keys)),
+            'mixed_specs': tuple(sorted(new_keys & existing_keys)),
+            'existing_only_specs': tuple(sorted(existing_keys - new_keys)),
+        }
+    return groups
+
 # ===================================================================
+# Baseline names are parsed once per row on every rerun, so both parsers are memoized
+@lru_cache(maxsize=1024)
 def extract_project_from_baseline_name(baseline_name: str) -> str:
     """
     Extract logical project name from baseline filename.
@@ -176,19 +295,43 @@ def extract_project_from_baseline_name(baseline_name: str) -> str:
     AutomationAPI_Flexi1_automation_api_baseline_20260105_164029.json
     -> Flexi1
     """
-    name = baseline_name.replace(".json", "")
-    parts = name.split("_")
+    name = baseline_name.removesuffix(".json")
 
     # Expected pattern:
     # AutomationAPI_<PROJECT>_automation_api_baseline_<timestamp>
-    try:
-        return parts[1]
-    except IndexError:
+    _, sep, rest = name.partition("_")
+    if not sep:
         return "UNKNOWN_PROJECT"
+    return rest.partition("_")[0]
 
 # ===================================================================
 # Constants
 APP_VERSION = "4.0.0"
+PROJECTS_PER_PAGE = 10  # project expanders shown per page on the Baseline Tracker
+BASELINE_LIST_HEAD = 10  # rows of a project's baseline list shown before "Show all"
+
+# Sidebar navigation
+PAGES = {
+    'dashboard': {'icon': '📊', 'label': 'Dashboard'},
+    'provar': {'icon': '🔍', 'label': 'Provar Reports'},
+    'automation_api': {'icon': '🔧', 'label': 'AutomationAPI Reports'},
+    'baselines': {'icon': '📈', 'label': 'Baseline Tracker'},
+    'settings': {'icon': '⚙️', 'label': 'Settings'}
+}
+
+# Page Headers
+PAGE_HEADERS = {
+    'dashboard': ('📊 Dashboard', 'Overview and quick stats'),
+    'Provar Application': ('🔍 Provar Application Reports', 'Analyze Provar XML reports'),
+    'automation_api': ('🔧 Test Builder Reports', 'Analyze AutomationAPI XML reports'),
+    'baselines': ('📈 Baseline Tracker', 'Manage and track baselines'),
+    'settings': ('⚙️ Settings', 'Configure application settings')
+}
+
+# "_provar" / "_baseline" segment that ends the project part of a Provar baseline name
+_PROVAR_STOP_RE = re.compile(r"(?:^|_)(?:provar|baseline)(?=_|$)", re.IGNORECASE)
+
+@lru_cache(maxsize=1024)
 def extract_provar_project_from_baseline(filename: str) -> str:
     """
     Extract EXACT Provar project name from baseline filename.
@@ -197,56 +340,76 @@ def extract_provar_project_from_baseline(filename: str) -> str:
     Provar_Smoke_CC_Windows_provar_baseline_20260105_083448.json
     → Smoke_CC_Windows
     """
-    name = filename.replace(".json", "")
-    parts = name.split("_")
-
-    try:
-        # Remove platform prefix
-        if parts[0].lower() == "provar":
-            parts = parts[1:]
-
-        # Stop at baseline marker
-        stop_words = {"provar", "baseline"}
-        project_parts = []
-        for part in parts:
-            if part.lower() in stop_words:
-                break
-            project_parts.append(part)
-
-        return "_".join(project_parts) if project_parts else "UNKNOWN_PROJECT"
-    except Exception:
+    name = filename.removesuffix(".json")
+
+    # Remove platform prefix
+    prefix, sep, rest = name.partition("_")
+    if prefix.lower() == "provar":
+        if not sep:
+            return "UNKNOWN_PROJECT"
+        name = rest
+
+    # Stop at baseline marker
+    stop = _PROVAR_STOP_RE.search(name)
+    if stop is None:
+        return name
+    if stop.start() == 0 and not name.startswith("_"):
         return "UNKNOWN_PROJECT"
+    return name[:stop.start()]
 
 
 # ===================================================================
 # CACHING AND SESSION STATE INITIALIZATION
 # ===================================================================
 
-@st.cache_data(ttl=1800)  # Cache for 30 minutes
+# Baselines live in the per-session cache, so the listing is memoized in
+# st.session_state rather than st.cache_data (which is shared across sessions
+# and pickles on every hit). Entries are dropped when the cache version changes.
 def load_cached_baselines(platform, project=None):
     """Load baselines with caching to improve performance"""
+    memo = st.session_state.setdefault("baseline_list_memo", {})
+    version = baseline_service.get_cache_version()
+    key = (platform, project)
+    
+    cached = memo.get(key)
+    if cached and cached[0] == version:
+        return cached[1]
+    
     try:
-        if project:
-            return baseline_service.list(platform=platform, project=project)
-        return baseline_service.list(platform=platform)
+        baselines = baseline_service.list(platform=platform, project=project)
     except Exception as e:
         st.error(f"Error loading baselines: {e}")
         return []
+    
+    memo[key] = (version, baselines)
+    return baselines
 
-@st.cache_data(ttl=1800)
-def get_baseline_projects(platform):
-    """Get unique projects for a platform"""
-    try:
-        baselines = baseline_service.list(platform=platform)
-        projects = set()
-        for baseline in baselines:
-            parts = baseline['name'].split('_')
-            if len(parts) >= 3:
-                project = parts[1]
-                projects.add(project)
-        return sorted(list(projects))
-    except Exception as e:
-        return []
+def group_baselines_by_project(platform):
+    """(project, baselines, by_name) triples sorted by project - memoized like the listing"""
+    memo = st.session_state.setdefault("baseline_group_memo", {})
+    version = baseline_service.get_cache_version()
+    
+    cached = memo.get(platform)
+    if cached and cached[0] == version:
+        return cached[1]
+    
+    baselines_by_project = {}
+    for baseline in load_cached_baselines(platform):
+        if platform == "provar":
+            project_name = extract_provar_project_from_baseline(baseline["name"])
+        else:
+            project_name = baseline.get("project") or extract_project_from_baseline_name(baseline["name"])
+        
+        baselines_by_project.setdefault(project_name, []).append(baseline)
+    
+    # No per-project sort needed: the listing is already newest first
+    # and grouping keeps that order
+    grouped = [
+        (project_name, baselines, {b['name']: b for b in baselines})
+        for project_name, baselines in sorted(baselines_by_project.items())
+    ]
+    memo[platform] = (version, grouped)
+    return grouped
 
 # Initialize session state
 if 'current_page' not in st.session_state:
@@ -262,22 +425,43 @@ if 'baselines_cache' not in st.session_state:
 # HELPER FUNCTIONS
 # ===================================================================
 
+# Timestamp formats seen in Provar/JUnit reports (in order of preference)
+EXECUTION_TIME_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%a %b %d %H:%M:%S %Z %Y",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%d/%m/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+)
+
+# (has "T", ends with "Z", has ".", has "/", starts with a letter) -> likely formats
+_EXECUTION_TIME_SHAPES = {
+    (True, False, False, False, False): ("%Y-%m-%dT%H:%M:%S",),
+    (True, False, True, False, False): ("%Y-%m-%dT%H:%M:%S.%f",),
+    (True, True, False, False, False): ("%Y-%m-%dT%H:%M:%SZ",),
+    (False, False, False, False, False): ("%Y-%m-%d %H:%M:%S",),
+    (False, False, False, True, False): ("%d/%m/%Y %H:%M:%S", "%m/%d/%Y %H:%M:%S"),
+}
+
+def _execution_time_shape(raw_time: str):
+    """Cheap structural fingerprint of a timestamp string"""
+    if raw_time[:1].isalpha():
+        return (False, False, False, False, True)
+    return ("T" in raw_time, raw_time.endswith("Z"), "." in raw_time, "/" in raw_time, False)
+
+@lru_cache(maxsize=4096)
 def format_execution_time(raw_time: str):
     """Format timestamp from XML to readable format"""
     if raw_time in (None, "", "Unknown"):
         return "Unknown"
     
-    formats_to_try = [
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%d %H:%M:%S",
-        "%a %b %d %H:%M:%S %Z %Y",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%d/%m/%Y %H:%M:%S",
-        "%m/%d/%Y %H:%M:%S",
-    ]
-    
-    for fmt in formats_to_try:
+    # Try the format matching the string's shape first, the full list only on a miss
+    likely_formats = _EXECUTION_TIME_SHAPES.get(
+        _execution_time_shape(raw_time), ("%a %b %d %H:%M:%S %Z %Y",)
+    )
+    for fmt in likely_formats + EXECUTION_TIME_FORMATS:
         try:
             dt = datetime.strptime(raw_time, fmt)
             return dt.strftime("%d %b %Y, %H:%M UTC")
@@ -286,6 +470,8 @@ def format_execution_time(raw_time: str):
     
     return raw_time
 
+# One entry per distinct baseline timestamp; they never change, so hits approach 100%
+@lru_cache(maxsize=2048)
 def _format_time(ts: str):
     """Format timestamp string to readable format"""
     try:
@@ -294,14 +480,42 @@ def _format_time(ts: str):
     except Exception:
         return ts
 
-def safe_extract_failures(uploaded_file):
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _extract_failures_cached(file_bytes: bytes, filename: str):
+    """Parse a Provar XML report - cached on the file content, so reruns don't re-parse"""
+    return extract_failed_tests(io.BytesIO(file_bytes))
+
+@st.cache_data(show_spinner=False, ttl=24 * 60 * 60)
+def _extract_api_failures_cached(file_bytes: bytes, filename: str):
+    """Parse an AutomationAPI XML report - cached on the file content"""
+    xml_file = io.BytesIO(file_bytes)
+    xml_file.name = filename  # used as the failure "source"
+    return extract_automation_api_failures(xml_file)
+
+def safe_extract_failures(file_name, file_bytes):
     try:
-        uploaded_file.seek(0)
-        return extract_failed_tests(uploaded_file)
+        return _extract_failures_cached(file_bytes, file_name)
     except Exception as e:
-        st.error(f"Error parsing {uploaded_file.name}: {str(e)}")
+        st.error(f"Error parsing {file_name}: {str(e)}")
         return []
 
+# Lower-cased project names, computed once instead of per file
+LOWER_PROJECTS = tuple((p, p.lower()) for p in KNOWN_PROJECTS)
+
+# Every failure of a report, and every report of the same job, shares one
+# path - so the KNOWN_PROJECTS scan runs once per distinct path
+@lru_cache(maxsize=1024)
+def project_from_path(path: str):
+    """First project of KNOWN_PROJECTS named in the path, or None"""
+    if path:
+        for p in KNOWN_PROJECTS:
+            if p in path:
+                return p
+    return None
+
+# Pure function of (path, filename) - reruns and repeated uploads hit the cache.
+# The loops keep KNOWN_PROJECTS order as the priority when several names match.
+@lru_cache(maxsize=1024)
 def detect_project(path: str, filename: str):
     """
     Improved project detection that checks both path and filename
@@ -310,32 +524,31 @@ def detect_project(path: str, filename: str):
     # First, check if filename is generic (like "JUnit (39).xml")
     if filename.startswith("JUnit") and "(" in filename and ")" in filename:
         # This is a generic name, rely on path only
-        if path:
-            for p in KNOWN_PROJECTS:
-                if f"/{p}" in path or f"\\{p}" in path or p in path:
-                    return p
-        return "UNKNOWN_PROJECT"
+        return project_from_path(path) or "UNKNOWN_PROJECT"
     
     # Check path first (most reliable)
-    if path:
-        for p in KNOWN_PROJECTS:
-            if f"/{p}" in path or f"\\{p}" in path or p in path:
-                return p
+    path_project = project_from_path(path)
+    if path_project:
+        return path_project
     
     # Check filename
-    for p in KNOWN_PROJECTS:
-        if p.lower() in filename.lower():
+    filename_lower = filename.lower()
+    for p, p_lower in LOWER_PROJECTS:
+        if p_lower in filename_lower:
             return p
     
     # Special cases
-    if "datetime" in filename.lower():
+    if "datetime" in filename_lower:
         return "Date_Time"
     
-    if "hybrid" in filename.lower():
+    if "hybrid" in filename_lower:
         return "Hybrid0"
     
     return "UNKNOWN_PROJECT"
 
+# Every failure of a report carries the same path - cached, so they also
+# share one shortened string instead of a copy per row
+@lru_cache(maxsize=1024)
 def shorten_project_cache_path(path):
     if not path:
         return ""
@@ -344,6 +557,113 @@ def shorten_project_cache_path(path):
         return path.split(marker, 1)[1]
     return path.replace("/", "\\").split("\\")[-1]
 
+def analyze_provar_report(file_name, file_bytes, get_baseline_sigs):
+    """
+    Parse one Provar report and compare it with its project's latest baseline
+    Returns the result shown on the Provar page (without AI text), or None
+    """
+    failures = safe_extract_failures(file_name, file_bytes)
+    if not failures:
+        return None
+    
+    detected_project = None
+    project_path = failures[0].get("projectCachePath", "")
+    
+    # Method 1: Use "project" field from XML if available
+    if failures[0].get("project") and failures[0].get("project") != "Unknown":
+        detected_project = failures[0].get("project")
+        print(f"✅ Project from XML field: {detected_project}")
+    
+    # Method 2: Extract from projectCachePath
+    if not detected_project and project_path:
+        detected_project = project_from_path(project_path)
+        if detected_project:
+            print(f"✅ Project from path: {detected_project}")
+    
+    # Method 3: Use detect_project helper
+    if not detected_project:
+        detected_project = detect_project(project_path, file_name)
+        print(f"✅ Project from detect_project: {detected_project}")
+    
+    # Method 4: Last resort - use filename if meaningful
+    if not detected_project or detected_project == "UNKNOWN_PROJECT":
+        filename = file_name.replace(".xml", "")
+        # Only use filename if it's not a generic pattern
+        if not (filename.startswith("JUnit") and "(" in filename):
+            detected_project = filename
+        else:
+            detected_project = "UNKNOWN_PROJECT"
+    
+    print(f"📁 Final detected project: {detected_project} (from {file_name})")
+    
+    # Capture timestamp from first failure
+    execution_time = failures[0].get("timestamp", "Unknown")
+    
+    # Clean report (only the __NO_FAILURES__ record) - nothing to normalize
+    # or compare, only whether the project has a baseline
+    if failures[0].get("_no_failures"):
+        return {
+            'filename': file_name,
+            'project': detected_project,
+            'new_failures': [],
+            'existing_failures': [],
+            'new_count': 0,
+            'existing_count': 0,
+            'total_count': 0,
+            'baseline_exists': bool(load_cached_baselines("provar", detected_project)),
+            'execution_time': execution_time
+        }
+    
+    # Retried testcases repeat the same failure - keep one row
+    # per (testcase, error) and count how often it occurred
+    unique_failures = {}
+    for f in failures:
+        if f.get("name") == "__NO_FAILURES__":
+            continue
+        key = (f["name"], f["error"])
+        if key in unique_failures:
+            unique_failures[key]["occurrences"] += 1
+            continue
+        unique_failures[key] = {
+            "testcase": f["name"],
+            "testcase_path": f.get("testcase_path", ""),
+            "error": f["error"],
+            "details": f["details"],
+            "source": file_name,
+            "webBrowserType": f.get("webBrowserType", "Unknown"),
+            "projectCachePath": shorten_project_cache_path(f.get("projectCachePath", "")),
+            "occurrences": 1,
+        }
+    normalized = list(unique_failures.values())
+    
+    # -----------------------------------------------------------
+    # BASELINE COMPARISON LOGIC (FROM OLD APP.PY)
+    # -----------------------------------------------------------
+    baseline_exists_flag, baseline_sigs = get_baseline_sigs(detected_project)
+
+    if baseline_sigs:
+        new_f = []
+        existing_f = []
+        for failure in normalized:
+            (existing_f if (failure['testcase'], failure['error']) in baseline_sigs else new_f).append(failure)
+    else:
+        # No baseline or an empty one - all failures are new
+        new_f = normalized
+        existing_f = []
+    # -----------------------------------------------------------
+    
+    return {
+        'filename': file_name,
+        'project': detected_project,
+        'new_failures': new_f,
+        'existing_failures': existing_f,
+        'new_count': len(new_f),
+        'existing_count': len(existing_f),
+        'total_count': len(normalized),
+        'baseline_exists': baseline_exists_flag,
+        'execution_time': execution_time
+    }
+
 def render_summary_card(xml_name, new_count, existing_count, total_count):
     """Render a summary card for each XML file"""
     status_color = "🟢" if new_count == 0 else "🔴"
@@ -358,33 +678,22 @@ def render_summary_card(xml_name, new_count, existing_count, total_count):
     with col4:
         st.metric("Total Failures", total_count)
 
-def render_comparison_chart(all_results):
-    """Create a comparison chart across all uploaded XMLs"""
-    if not all_results:
-        return
-    
-    df_data = []
-    for result in all_results:
-        df_data.append({
-            'File': result['project'],
-            'New Failures': result['new_count'],
-            'Existing Failures': result['existing_count'],
-            'Total': result['total_count']
-        })
-    
-    df = pd.DataFrame(df_data)
+@st.cache_data(show_spinner=False)
+def _build_comparison_figure(files, new_counts, existing_counts):
+    """Build the comparison figure - cached, so reruns don't rebuild it"""
+    import plotly.graph_objects as go
     
     fig = go.Figure()
     fig.add_trace(go.Bar(
         name='New Failures',
-        x=df['File'],
-        y=df['New Failures'],
+        x=files,
+        y=new_counts,
         marker_color='#FF4B4B'
     ))
     fig.add_trace(go.Bar(
         name='Existing Failures',
-        x=df['File'],
-        y=df['Existing Failures'],
+        x=files,
+        y=existing_counts,
         marker_color='#FFA500'
     ))
     
@@ -396,91 +705,172 @@ def render_comparison_chart(all_results):
         height=400,
         hovermode='x unified'
     )
+    return fig
+
+def failures_to_csv(failures):
+    """CSV export of failure dicts - same columns as DataFrame.to_csv, without pandas"""
+    fieldnames = list(dict.fromkeys(key for f in failures for key in f))
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(failures)
+    return buffer.getvalue()
+
+def result_csv(result, rows):
+    """CSV export of an analysis result - built the first time its download
+    button is drawn and kept on the result, not rebuilt on every rerun"""
+    csv_text = result.get('csv_export')
+    if csv_text is None:
+        csv_text = result['csv_export'] = failures_to_csv(rows)
+    return csv_text
+
+# Keyed on the baseline name only - a baseline file never changes once saved,
+# and skipping the hash of a large failures list is the point of caching
+@st.cache_data(show_spinner=False, ttl=60 * 60)
+def _baseline_failures_csv(baseline_name, _failures):
+    """CSV export of a baseline's failures"""
+    return failures_to_csv(_failures)
+
+@st.fragment
+def render_comparison_chart(all_results):
+    """Create a comparison chart across all uploaded XMLs"""
+    if not all_results:
+        return
     
+    # Plain tuples - Plotly takes them directly and they hash for the figure cache
+    fig = _build_comparison_figure(
+        tuple(r['project'] for r in all_results),
+        tuple(r['new_count'] for r in all_results),
+        tuple(r['existing_count'] for r in all_results)
+    )
     st.plotly_chart(fig, use_container_width=True)
-    # ===================================================================
-# PAGE CONFIGURATION
-# ===================================================================
 
-st.set_page_config(
-    "Provar AI - Multi-Platform XML Analyzer",
-    layout="wide",
-    page_icon="🚀",
-    initial_sidebar_state="expanded"
-)
+def render_batch_analysis(batch_analysis):
+    """Show the AI batch pattern analysis for the whole upload"""
+    st.markdown('<div class="ai-feature-box">', unsafe_allow_html=True)
+    st.markdown("## 🧠 AI Batch Pattern Analysis")
+    st.markdown("AI has analyzed all failures together to identify patterns and priorities.")
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown(batch_analysis)
+
+def render_ai_tabs(testcase, error, details, ai_bundle, key):
+    """AI Analysis / Jira / Improvements tabs for one failure.
+    Shows the text precomputed by Analyze All. Pieces it doesn't have
+    (e.g. a feature enabled after the analysis) are only requested when
+    the user clicks "Run AI analysis" - expander bodies run even when
+    collapsed, so requesting them inline would call the AI for every
+    failure on the page."""
+    load_ai_modules()
+    failure_key = ai_failure_key(testcase, error, details)
+    live_results = st.session_state.setdefault("ai_live_results", {})
+    ai_result = {**ai_bundle.get(failure_key, {}), **live_results.get(failure_key, {})}
+    
+    wanted = ["summary"]
+    if enable_jira_generation:
+        wanted.append("jira")
+    if enable_test_improvements:
+        wanted.append("improvements")
+    missing = [piece for piece in wanted if ai_result.get(piece) is None]
+    
+    if missing:
+        if not st.button("🤖 Run AI analysis", key=f"ai_run_{key}"):
+            return
+        live = live_results.setdefault(failure_key, {})
+        with st.spinner("Analyzing..."):
+            if "summary" in missing:
+                live["summary"] = generate_ai_summary(testcase, error, details)
+            if "jira" in missing:
+                live["jira"] = generate_jira_ticket(
+                    testcase, error, details, live.get("summary") or ai_result.get("summary")
+                )
+            if "improvements" in missing:
+                live["improvements"] = suggest_test_improvements(testcase, error, details)
+        ai_result.update(live)
+    
+    ai_tabs = ["🤖 AI Analysis"]
+    if enable_jira_generation:
+        ai_tabs.append("📝 Jira Ticket")
+    if enable_test_improvements:
+        ai_tabs.append("💡 Improvements")
+    
+    ai_tab_objects = st.tabs(ai_tabs)
+    
+    with ai_tab_objects[0]:
+        st.info(ai_result["summary"])
+    
+    if enable_jira_generation:
+        with ai_tab_objects[1]:
+            jira_content = ai_result["jira"]
+            st.markdown(jira_content)
+            st.download_button(
+                "📥 Download Jira Content",
+                jira_content,
+                file_name=f"jira_{testcase[:30]}.txt",
+                key=f"jira_{key}"
+            )
+    
+    if enable_test_improvements:
+        with ai_tab_objects[-1]:
+            st.success(ai_result["improvements"])
 
-# Custom CSS
-st.markdown("""
-    <style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        padding: 1rem 0;
-    }
-    .section-divider {
-        border-top: 2px solid #e0e0e0;
-        margin: 2rem 0;
-    }
-    .nav-button {
-        width: 100%;
-        text-align: left;
-        padding: 0.5rem 1rem;
-        margin: 0.2rem 0;
-        border-radius: 5px;
-        border: none;
-        background: transparent;
-        cursor: pointer;
-    }
-    .nav-button:hover {
-        background: #f0f2f6;
-    }
-    .nav-button-active {
-        background: #e3f2fd;
-        border-left: 4px solid #1f77b4;
-    }
-    .ai-feature-box {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        color: white;
-        margin: 1rem 0;
-    }
-    .spec-group {
-        background: #f8f9fa;
-        border-left: 4px solid #667eea;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 8px;
-    }
-    .real-failure {
-        border-left: 4px solid #dc3545;
-    }
-    .skipped-failure {
-        border-left: 4px solid #ffc107;
-        background: #fff9e6;
-    }
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    </style>
-""", unsafe_allow_html=True)
 
 # ===================================================================
 # NAVIGATION INITIALIZATION
 # ===================================================================
 
-if 'current_page' not in st.session_state:
-    st.session_state.current_page = 'dashboard'
-
-# Auto-sync baselines from GitHub
+# Auto-sync baselines from GitHub in the background, so the first paint isn't
+# blocked on it. Workers can't touch st.session_state, so they only download;
+# the result is applied to the cache here on a later run.
 if "baselines_synced" not in st.session_state:
-    st.session_state.baselines_synced = True
+    st.session_state.baselines_synced = False
+    st.session_state.baseline_sync_future = get_executor().submit(baseline_service.fetch_from_github)
+
+sync_future = st.session_state.get("baseline_sync_future")
+if sync_future is not None and sync_future.done():
+    del st.session_state.baseline_sync_future
+    try:
+        synced = baseline_service.apply_sync(sync_future.result())
+        st.session_state.baselines_synced = True
+        if synced:
+            st.toast(f"✅ Synced {synced} baseline(s) from GitHub")
+        else:
+            st.toast("ℹ️ No baselines found in GitHub")
+    except Exception as e:
+        print(f"⚠️ Background sync failed: {e}")
+
+def start_baseline_sync(platform=None):
+    """Button callback - download baselines (one platform, or all) in the background.
+    The result is applied above on a later run; poll_baseline_sync triggers that run."""
+    if "baseline_sync_future" in st.session_state:
+        return
+    github_connection_probe.clear()
+    st.session_state.baseline_sync_future = get_executor().submit(baseline_service.fetch_from_github, platform)
+
+@st.fragment(run_every=1)
+def poll_baseline_sync():
+    """Checks the background sync once a second without holding up the script.
+    When it has finished, reruns the app so the result is applied above."""
+    sync_future = st.session_state.get("baseline_sync_future")
+    if sync_future is None:
+        return
+    if sync_future.done():
+        st.rerun()
+    st.caption("🔄 Syncing in the background...")
 
 # ===================================================================
 # SIDEBAR - NAVIGATION & SETTINGS
 # ===================================================================
 
+def go_to_page(page_key):
+    """Button callback - runs before the rerun Streamlit does for the click,
+    so no extra st.rerun() is needed"""
+    st.session_state.current_page = page_key
+
+def set_session_flag(key, value=True):
+    """Button callback - store a flag in session_state before the rerun"""
+    st.session_state[key] = value
+
 with st.sidebar:
     st.title("🤖 Provar Report Analyzer Ai")
     st.caption(f"v{APP_VERSION}")
@@ -489,45 +879,43 @@ with st.sidebar:
     st.markdown("### 🧭 Navigation")
     
     # Navigation buttons
-    pages = {
-        'dashboard': {'icon': '📊', 'label': 'Dashboard'},
-        'provar': {'icon': '🔍', 'label': 'Provar Reports'},
-        'automation_api': {'icon': '🔧', 'label': 'AutomationAPI Reports'},
-        'baselines': {'icon': '📈', 'label': 'Baseline Tracker'},
-        'settings': {'icon': '⚙️', 'label': 'Settings'}
-    }
-    
-    for page_key, page_info in pages.items():
+    for page_key, page_info in PAGES.items():
         is_active = st.session_state.current_page == page_key
         button_label = f"{page_info['icon']} {page_info['label']}"
         
-        if st.button(
+        st.button(
             button_label,
             key=f"nav_{page_key}",
             use_container_width=True,
             type="primary" if is_active else "secondary",
-            disabled=is_active
-        ):
-            st.session_state.current_page = page_key
-            st.rerun()
+            disabled=is_active,
+            on_click=go_to_page,
+            args=(page_key,)
+        )
     
     st.markdown("---")
     
     # GitHub Connection Status
     st.markdown("### 🔗 GitHub Status")
+    # Placeholder first, so the rest of the sidebar isn't held up by the API call
+    status_slot = st.empty()
+    status_slot.caption("🔄 Checking connection...")
     try:
-        test_list = github.list_baselines()
-        st.success(f"✅ Connected")
-        st.caption(f"Found {len(test_list)} baseline(s)")
+        github_count = github_connection_probe()
+        with status_slot.container():
+            st.success(f"✅ Connected")
+            st.caption(f"Found {github_count} baseline(s)")
     except Exception as e:
-        st.error("❌ Connection Failed")
-        st.caption(str(e)[:50])
+        with status_slot.container():
+            st.error("❌ Connection Failed")
+            st.caption(str(e)[:50])
     
-    if st.button("🔄 Sync from GitHub", use_container_width=True):
-        with st.spinner("Syncing..."):
-            synced = baseline_service.sync_from_github()
-        st.success(f"✅ Synced {synced} baseline(s)")
-        st.rerun()
+    sync_pending = "baseline_sync_future" in st.session_state
+    # Every sync button submits through start_baseline_sync; this poller
+    # (drawn on every page) reruns the app once the download is done
+    st.button("🔄 Sync from GitHub", use_container_width=True, disabled=sync_pending, on_click=start_baseline_sync)
+    if "baseline_sync_future" in st.session_state:
+        poll_baseline_sync()
     
     st.markdown("---")
     
@@ -555,13 +943,15 @@ with st.sidebar:
     if 'upload_stats' in st.session_state:
         st.markdown("### 📊 Stats")
         stats = st.session_state.upload_stats
-        st.info(f"**Files:** {stats.get('count', 0)}")
-        st.info(f"**Total Failures:** {stats.get('total_failures', 0)}")
-        st.info(f"**New Failures:** {stats.get('new_failures', 0)}")
+        # One read-only box instead of one element per line
+        st.info(
+            f"**Files:** {stats.get('count', 0)}  \n"
+            f"**Total Failures:** {stats.get('total_failures', 0)}  \n"
+            f"**New Failures:** {stats.get('new_failures', 0)}"
+        )
     
     # AI Status
-    st.markdown("---")
-    st.markdown("### 🤖 AI Status")
+    st.markdown("---\n\n### 🤖 AI Status")
     groq_key = os.getenv("GROQ_API_KEY")
     openai_key = os.getenv("OPENAI_API_KEY")
     
@@ -579,37 +969,30 @@ with st.sidebar:
 current_page = st.session_state.current_page
 
 # Page Headers
-page_headers = {
-    'dashboard': ('📊 Dashboard', 'Overview and quick stats'),
-    'Provar Application': ('🔍 Provar Application Reports', 'Analyze Provar XML reports'),
-    'automation_api': ('🔧 Test Builder Reports', 'Analyze AutomationAPI XML reports'),
-    'baselines': ('📈 Baseline Tracker', 'Manage and track baselines'),
-    'settings': ('⚙️ Settings', 'Configure application settings')
-}
-
-if current_page in page_headers:
-    header, description = page_headers[current_page]
+if current_page in PAGE_HEADERS:
+    header, description = PAGE_HEADERS[current_page]
     st.markdown(f'<div class="main-header">{header}</div>', unsafe_allow_html=True)
     st.caption(description)
-    st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+    st.html(DIVIDER_HTML)
     # ===================================================================
 # DASHBOARD PAGE
 # ===================================================================
 
-if current_page == 'dashboard':
+def render_dashboard_page():
     st.markdown("## 📊 Overview")
     
     try:
-        provar_files = baseline_service.list(platform="provar")
-        api_files = baseline_service.list(platform="automation_api")
+        # Only the counts are shown, so don't build the listings
+        provar_count = baseline_service.count("provar")
+        api_count = baseline_service.count("automation_api")
         
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            st.metric("🔍 Provar Baselines", len(provar_files))
+            st.metric("🔍 Provar Baselines", provar_count)
         with col2:
-            st.metric("🔧 API Baselines", len(api_files))
+            st.metric("🔧 API Baselines", api_count)
         with col3:
-            st.metric("📊 Total Baselines", len(provar_files) + len(api_files))
+            st.metric("📊 Total Baselines", provar_count + api_count)
         with col4:
             if 'upload_stats' in st.session_state:
                 st.metric("🆕 Recent Uploads", st.session_state.upload_stats.get('count', 0))
@@ -637,22 +1020,16 @@ if current_page == 'dashboard':
     
     col1, col2, col3 = st.columns(3)
     with col1:
-        if st.button("🔍 Analyze Provar", use_container_width=True, type="primary"):
-            st.session_state.current_page = 'provar'
-            st.rerun()
+        st.button("🔍 Analyze Provar", use_container_width=True, type="primary", on_click=go_to_page, args=('provar',))
     with col2:
-        if st.button("🔧 Analyze API", use_container_width=True, type="primary"):
-            st.session_state.current_page = 'automation_api'
-            st.rerun()
+        st.button("🔧 Analyze API", use_container_width=True, type="primary", on_click=go_to_page, args=('automation_api',))
     with col3:
-        if st.button("📈 View Baselines", use_container_width=True, type="primary"):
-            st.session_state.current_page = 'baselines'
-            st.rerun()
+        st.button("📈 View Baselines", use_container_width=True, type="primary", on_click=go_to_page, args=('baselines',))
 # ===================================================================
 # BASELINES PAGE SECTION
 # ===================================================================
 
-elif current_page == 'baselines':
+def render_baselines_page():
     st.markdown("## 📈 Baseline Tracker")
     
     # ====================================================================
@@ -665,7 +1042,6 @@ elif current_page == 'baselines':
         last_sync = sync_status['last_sync']
         if last_sync:
             try:
-                from datetime import datetime
                 sync_dt = datetime.fromisoformat(last_sync)
                 sync_display = sync_dt.strftime("%d %b %Y, %H:%M")
             except:
@@ -674,6 +1050,8 @@ elif current_page == 'baselines':
             sync_display = "Recently"
         
         st.success(f"⚡ **Fast Mode Active** - Using cached data | Last synced: {sync_display}")
+    elif "baseline_sync_future" in st.session_state:
+        st.info("🔄 Syncing baselines from GitHub in the background...")
     else:
         st.warning(f"🐌 **Slow Mode** - Cache empty, will load from GitHub (slower)")
         st.info("💡 **Tip:** Click 'Sync from GitHub' below to enable fast mode")
@@ -692,25 +1070,19 @@ elif current_page == 'baselines':
             index=0 if st.session_state.baseline_platform_filter == 'provar' else 1
         )
         
-        if platform_filter != st.session_state.baseline_platform_filter:
-            st.session_state.baseline_platform_filter = platform_filter
-            st.rerun()
+        # The selectbox already returns the new platform on this run - no extra rerun
+        st.session_state.baseline_platform_filter = platform_filter
     
     with col2:
-        if st.button("🔄 Refresh", use_container_width=True, help="Refresh current view"):
-            st.rerun()
+        # The click's own rerun redraws the view
+        st.button("🔄 Refresh", use_container_width=True, help="Refresh current view")
     
     with col3:
-        if st.button("📡 Sync GitHub", use_container_width=True, help="Download/restore from GitHub", type="primary"):
-            with st.spinner(f"Syncing {platform_filter} baselines from GitHub..."):
-                synced = baseline_service.sync_from_github(platform=platform_filter)
-            
-            if synced > 0:
-                st.success(f"✅ Synced {synced} baseline(s) from GitHub!")
-                st.balloons()
-            else:
-                st.info("ℹ️ No baselines found in GitHub for this platform")
-            st.rerun()
+        st.button(
+            "📡 Sync GitHub", use_container_width=True, help="Download/restore from GitHub", type="primary",
+            disabled="baseline_sync_future" in st.session_state,
+            on_click=start_baseline_sync, args=(platform_filter,)
+        )
     
     with col4:
         if st.button("🗑️ Clear", use_container_width=True, help="Clear cache (admin only)"):
@@ -742,22 +1114,14 @@ elif current_page == 'baselines':
             col1, col2, col3 = st.columns([1, 2, 1])
             
             with col2:
-                if st.button(
+                st.button(
                     "📥 Sync All Baselines from GitHub", 
                     type="primary", 
                     use_container_width=True,
-                    key="first_sync_button"
-                ):
-                    with st.spinner("🔄 Syncing all baselines from GitHub..."):
-                        synced = baseline_service.sync_from_github()
-                    
-                    if synced > 0:
-                        st.balloons()
-                        st.success(f"✅ Successfully synced {synced} baseline(s)!")
-                        st.info("⚡ **Fast mode enabled!** Your baselines are now cached for instant access.")
-                        st.rerun()
-                    else:
-                        st.warning("No baselines found in GitHub. Upload some reports to create baselines!")
+                    key="first_sync_button",
+                    disabled="baseline_sync_future" in st.session_state,
+                    on_click=start_baseline_sync
+                )
             
             st.markdown("---")
     
@@ -798,7 +1162,7 @@ elif current_page == 'baselines':
     # ====================================================================
     try:
         # This loads from session_state cache (instant!)
-        all_baselines = baseline_service.list(platform=platform_filter)
+        all_baselines = load_cached_baselines(platform_filter)
     except Exception as e:
         st.error(f"Failed to load baselines: {e}")
         all_baselines = []
@@ -808,40 +1172,42 @@ elif current_page == 'baselines':
     # ====================================================================
     
     if all_baselines:
-        # Group baselines by project
-        baselines_by_project = {}
+        # Grouped and sorted once per cache change, not per rerun
+        project_items = group_baselines_by_project(platform_filter)
         
-        for baseline in all_baselines:
-            if platform_filter == "provar":
-                project_name = extract_provar_project_from_baseline(baseline["name"])
-            else:
-                project_name = baseline.get("project")
-                if not project_name:
-                    project_name = extract_project_from_baseline_name(baseline["name"])
-            
-            baselines_by_project.setdefault(project_name, []).append(baseline)
+        st.markdown(f"### 📂 Baselines by Project ({len(project_items)} projects)")
         
-        # Sort baselines within each project (newest first)
-        for project in baselines_by_project:
-            baselines_by_project[project].sort(
-                key=lambda b: b.get('created_at', ''),
-                reverse=True
-            )
+        # ====================================================================
+        # PAGINATION (only one page of expanders is built per rerun)
+        # ====================================================================
+        page_count = -(-len(project_items) // PROJECTS_PER_PAGE)
+        page = min(st.session_state.get('baseline_project_page', 0), page_count - 1)
         
-        st.markdown(f"### 📂 Baselines by Project ({len(baselines_by_project)} projects)")
+        if page_count > 1:
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col1:
+                st.button(
+                    "◀ Prev", key="baseline_page_prev", disabled=page == 0, use_container_width=True,
+                    on_click=set_session_flag, args=('baseline_project_page', page - 1)
+                )
+            with col2:
+                st.caption(f"Page {page + 1} of {page_count}")
+            with col3:
+                st.button(
+                    "Next ▶", key="baseline_page_next", disabled=page >= page_count - 1, use_container_width=True,
+                    on_click=set_session_flag, args=('baseline_project_page', page + 1)
+                )
         
         # ====================================================================
         # DISPLAY EACH PROJECT
         # ====================================================================
-        for project_name, project_baselines in sorted(baselines_by_project.items()):
+        for project_name, project_baselines, baselines_by_name in project_items[page * PROJECTS_PER_PAGE:(page + 1) * PROJECTS_PER_PAGE]:
             with st.expander(
                 f"📁 {project_name} ({len(project_baselines)} baseline(s))",
                 expanded=False
             ):
-                # Project summary
-                total_failures_in_project = 0
-                for baseline in project_baselines:
-                    total_failures_in_project += baseline.get('failure_count', 0)
+                # Project summary (counts come from the listing - no baseline loads)
+                total_failures_in_project = sum(b.get('failure_count', 0) for b in project_baselines)
                 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -851,19 +1217,23 @@ elif current_page == 'baselines':
                         latest_timestamp = project_baselines[0].get('created_at', '')
                         st.caption(f"📅 Latest: **{_format_time(latest_timestamp)}**")
                 
+                # Expander bodies run even when collapsed, so the selector, load and
+                # per-baseline list only run for projects the user has opened
+                if not st.toggle("📂 Show baselines", key=f"proj_open_{project_name}"):
+                    continue
+                
                 st.markdown("---")
                 
                 # Baseline selector dropdown
-                baseline_options = [b['name'] for b in project_baselines]
                 selected_baseline_name = st.selectbox(
                     "Select Baseline to View",
-                    options=baseline_options,
-                    format_func=lambda x: f"📅 {_format_time(next((b['created_at'] for b in project_baselines if b['name'] == x), ''))} - {next((b['label'] for b in project_baselines if b['name'] == x), 'Auto')}",
+                    options=list(baselines_by_name),
+                    format_func=lambda x, by_name=baselines_by_name: f"📅 {_format_time(by_name[x].get('created_at', ''))} - {by_name[x].get('label', 'Auto')}",
                     key=f"baseline_selector_{project_name}"
                 )
                 
                 # Find selected baseline
-                selected_baseline = next((b for b in project_baselines if b['name'] == selected_baseline_name), None)
+                selected_baseline = baselines_by_name.get(selected_baseline_name)
                 
                 if selected_baseline:
                     # Load baseline data (from cache - instant!)
@@ -890,12 +1260,10 @@ elif current_page == 'baselines':
                     
                     with col3:
                         if has_data and failure_count > 0:
-                            failures = baseline_data.get('failures', [])
-                            df = pd.DataFrame(failures)
-                            csv = df.to_csv(index=False)
+                            csv_data = _baseline_failures_csv(selected_baseline['name'], baseline_data.get('failures', []))
                             st.download_button(
                                 "📥 CSV",
-                                csv,
+                                csv_data,
                                 file_name=f"{selected_baseline['name']}_failures.csv",
                                 mime="text/csv",
                                 key=f"export_{selected_baseline['name']}",
@@ -908,6 +1276,7 @@ elif current_page == 'baselines':
                                 expected_key = os.getenv("BASELINE_ADMIN_KEY", "admin123")
                                 if admin_key == expected_key:
                                     baseline_service.delete(selected_baseline['name'], platform=platform_filter)
+                                    github_connection_probe.clear()  # sidebar count changed
                                     st.success("✅ Deleted from cache and GitHub!")
                                     st.rerun()
                                 else:
@@ -920,11 +1289,14 @@ elif current_page == 'baselines':
                         st.markdown("---")
                         
                         view_key = f"show_failures_{selected_baseline['name']}"
+                        # Read the flag once; session_state is only written when the user clicks
+                        show_failures = st.session_state.get(view_key, False)
                         
                         if st.button(f"👁️ View {failure_count} Failures", key=f"view_btn_{selected_baseline['name']}", use_container_width=True):
-                            st.session_state[view_key] = not st.session_state.get(view_key, False)
+                            show_failures = not show_failures
+                            st.session_state[view_key] = show_failures
                         
-                        if st.session_state.get(view_key, False):
+                        if show_failures:
                             st.markdown("### 📋 Failure Details")
                             
                             failures = baseline_data.get('failures', [])
@@ -953,25 +1325,34 @@ elif current_page == 'baselines':
                 st.markdown("---")
                 st.markdown("**📜 All Baselines in this Project:**")
                 
-                for idx, baseline in enumerate(project_baselines):
-                    timestamp = _format_time(baseline.get('created_at', ''))
-                    label = baseline.get('label', 'Auto')
-                    failure_count = baseline.get('failure_count', 0)
-                    
-                    col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                    
-                    with col1:
-                        st.caption(f"{idx+1}. 📅 {timestamp}")
-                    
-                    with col2:
-                        st.caption(f"🏷️ {label}")
-                    
-                    with col3:
-                        st.caption(f"❌ {failure_count}")
-                    
-                    with col4:
-                        if baseline['name'] == selected_baseline_name:
-                            st.caption("✅ **Selected**")
+                # Only the newest few rows unless the user asks for the full list
+                show_all_key = f"show_all_baselines_{project_name}"
+                show_all = st.session_state.get(show_all_key, False)
+                visible_baselines = project_baselines if show_all else project_baselines[:BASELINE_LIST_HEAD]
+                
+                # One table element instead of a row of columns per baseline
+                st.dataframe(
+                    [
+                        {
+                            '#': idx + 1,
+                            '📅 Created': _format_time(baseline.get('created_at', '')),
+                            '🏷️ Label': baseline.get('label', 'Auto'),
+                            '❌ Failures': baseline.get('failure_count', 0),
+                            'Selected': '✅' if baseline['name'] == selected_baseline_name else ''
+                        }
+                        for idx, baseline in enumerate(visible_baselines)
+                    ],
+                    hide_index=True,
+                    use_container_width=True
+                )
+                
+                if len(visible_baselines) < len(project_baselines):
+                    st.button(
+                        f"Show all {len(project_baselines)} baselines",
+                        key=f"show_all_btn_{project_name}",
+                        on_click=set_session_flag,
+                        args=(show_all_key,)
+                    )
     
     else:
         # No baselines found
@@ -995,27 +1376,24 @@ elif current_page == 'baselines':
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if st.button("📝 Go to Provar Reports", use_container_width=True, type="primary"):
-                st.session_state.current_page = 'provar'
-                st.rerun()
+            st.button("📝 Go to Provar Reports", use_container_width=True, type="primary", on_click=go_to_page, args=('provar',))
         
         with col2:
-            if st.button("🔧 Go to AutomationAPI Reports", use_container_width=True, type="primary"):
-                st.session_state.current_page = 'automation_api'
-                st.rerun()
+            st.button("🔧 Go to AutomationAPI Reports", use_container_width=True, type="primary", on_click=go_to_page, args=('automation_api',))
         
         with col3:
             if github_count > 0:
-                if st.button("📡 Sync from GitHub", use_container_width=True, type="primary"):
-                    with st.spinner("Syncing..."):
-                        synced = baseline_service.sync_from_github(platform=platform_filter)
-                    st.success(f"✅ Synced {synced} baseline(s)!")
-                    st.rerun()
+                st.button(
+                    "📡 Sync from GitHub", use_container_width=True, type="primary",
+                    key="empty_sync_button",
+                    disabled="baseline_sync_future" in st.session_state,
+                    on_click=start_baseline_sync, args=(platform_filter,)
+                )
 # ===================================================================
 # SETTINGS PAGE
 # ===================================================================
 
-elif current_page == 'settings':
+def render_settings_page():
     st.markdown("## ⚙️ Application Settings")
     
     # GitHub Settings
@@ -1025,8 +1403,7 @@ elif current_page == 'settings':
     with col1:
         st.markdown("**Connection Status**")
         try:
-            test_list = baseline_service.github.list_baselines()
-            st.success(f"✅ Connected ({len(test_list)} baselines)")
+            st.success(f"✅ Connected ({github_connection_probe()} baselines)")
         except Exception as e:
             st.error(f"❌ Failed: {str(e)[:50]}")
     
@@ -1064,16 +1441,234 @@ elif current_page == 'settings':
             st.rerun()
     
     with col2:
-        if st.button("🔄 Sync All Baselines", use_container_width=True):
-            with st.spinner("Syncing..."):
-                synced = baseline_service.sync_from_github()
-            st.success(f"✅ Synced {synced} baseline(s)")
-            st.rerun()
+        st.button(
+            "🔄 Sync All Baselines", use_container_width=True,
+            disabled="baseline_sync_future" in st.session_state,
+            on_click=start_baseline_sync
+        )
             # ===================================================================
 # PROVAR REPORTS PAGE (OLD LOGIC - WORKING VERSION)
 # ===================================================================
 
-elif current_page == 'provar':
+@st.fragment
+def render_provar_result(result, idx, multi_baselines):
+    """Result card for one Provar file. A fragment, so a click inside it
+    (save baseline, Run AI analysis, ...) reruns only this card instead of
+    redrawing every file's card; Recompare still reruns the whole page,
+    since the overall totals change"""
+    if MULTI_BASELINE_AVAILABLE and use_multi_baseline:
+        from baseline_engine import (
+            list_baselines,
+            compare_with_baseline as compare_multi_baseline
+        )
+    
+    formatted_time = format_execution_time(result.get("execution_time", "Unknown"))
+
+    with st.expander(
+        f"📄 {result['filename']} | ⏰ {formatted_time} — Project: {result['project']}",
+        expanded=False
+    ):
+        
+        # Summary card for this file
+        render_summary_card(
+            result['filename'],
+            result['new_count'],
+            result['existing_count'],
+            result['total_count']
+        )
+        
+        st.markdown("---")
+        
+        # Multi-baseline selection (if enabled)
+        if MULTI_BASELINE_AVAILABLE and use_multi_baseline:
+            st.markdown("### 🎯 Baseline Selection")
+            baselines, baseline_stats = multi_baselines[result['project']]
+            
+            if baselines:
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    baseline_options = ['Latest'] + [b['id'] for b in baselines]
+                    baselines_by_id = {b['id']: b for b in baselines}
+                    selected_baseline = st.selectbox(
+                        "Compare with baseline:",
+                        options=baseline_options,
+                        format_func=lambda x, by_id=baselines_by_id, latest=baselines[0]: f"Latest ({latest['label']}) - {latest['failure_count']} failures" if x == 'Latest' else f"{by_id[x]['label']} - {by_id[x]['failure_count']} failures",
+                        key=f"baseline_select_{idx}"
+                    )
+                
+                with col2:
+                    if st.button("🔄 Recompare", key=f"recompare_{idx}"):
+                        baseline_id = None if selected_baseline == 'Latest' else selected_baseline
+                        all_failures = result['new_failures'] + result['existing_failures']
+                        new_f, existing_f = compare_multi_baseline(
+                            result['project'],
+                            all_failures,
+                            baseline_id
+                        )
+                        result['new_failures'] = new_f
+                        result['existing_failures'] = existing_f
+                        result.pop('csv_export', None)  # rows reordered
+                        result['new_count'] = len(new_f)
+                        result['existing_count'] = len(existing_f)
+                        st.rerun()
+                
+                st.info(f"📊 {len(baselines)} baseline(s) available for {result['project']}")
+                
+                # Show baseline stats
+                if baselines:
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Total Baselines", baseline_stats['count'])
+                    with col2:
+                        st.metric("Latest", baseline_stats['latest'][:8] if baseline_stats['latest'] else '-')
+                    with col3:
+                        st.metric("Oldest", baseline_stats['oldest'][:8] if baseline_stats.get('oldest') else '-')
+            else:
+                st.warning(f"⚠️ No baseline found for {result['project']}")
+            
+            st.markdown("---")
+
+        # Tabs for different failure types
+        tab1, tab2, tab3 = st.tabs(["🆕 New Failures", "♻️ Existing Failures", "⚙️ Actions"])
+        
+        with tab1:
+            if result['new_count'] == 0:
+                st.success("✅ No new failures detected!")
+            else:
+                for i, f in enumerate(result['new_failures']):
+                    with st.expander(f"🆕 {i+1}. {f['testcase']}{occurrence_suffix(f)}", expanded=False):
+                        st.write("**Browser:**", f['webBrowserType'])
+                        st.markdown("**Path:**")
+                        st.code(f['testcase_path'], language="text")
+                        st.error(f"Error: {f['error']}")
+                        st.markdown("**Error Details (click copy icon):**")
+                        st.code(f['details'], language="text")
+                        
+                        # AI Features
+                        if use_ai:
+                            render_ai_tabs(
+                                f['testcase'],
+                                f['error'],
+                                f['details'],
+                                result.get('ai_bundle', {}),
+                                key=f"provar_{idx}_{i}"
+                            )
+                        
+                        st.markdown("---")
+        
+        with tab2:
+            if result['existing_count'] == 0:
+                st.info("ℹ️ No existing failures found in baseline")
+            else:
+                st.warning(f"Found {result['existing_count']} known failures")
+                for i, f in enumerate(result['existing_failures']):
+                    with st.expander(f"♻️ {i+1}. {f['testcase']}{occurrence_suffix(f)}", expanded=False):
+                        st.write("**Browser:**", f['webBrowserType'])
+                        st.markdown("**Path:**")
+                        st.code(f['testcase_path'], language="text")
+                        st.error(f"Error: {f['error']}")
+                        st.markdown("**Error Details:**")
+                        st.code(f['details'], language="text")
+                        st.markdown("---")
+        
+        with tab3:
+            st.markdown("### 🛠️ Baseline Management")
+            
+            # Project selection
+            st.markdown("### 📌 Select Project for Baseline")
+            project_options = KNOWN_PROJECTS
+            selected_project = result['project']
+            if result['project'] == "UNKNOWN_PROJECT":
+                selected_project = st.selectbox(
+                    "Choose correct project",
+                    options=project_options,
+                    key=f"project_select_{idx}"
+                )
+            else:
+                st.info(f"Detected Project: {result['project']}")
+            
+            # Save baseline section
+            col1, col2 = st.columns(2)
+            
+            # Multi-baseline save
+            if MULTI_BASELINE_AVAILABLE and use_multi_baseline:
+                with col1:
+                    baseline_label = st.text_input(
+                        "Baseline Label",
+                        value="Auto",
+                        key=f"label_{idx}",
+                        help="Custom label for this baseline (e.g., Sprint 23, Release 1.5)"
+                    )
+                
+                with col2:
+                    if st.button(f"💾 Save as New Baseline", key=f"save_multi_{idx}"):
+                        if not admin_key:
+                            st.error("❌ Admin key required!")
+                        else:
+                            expected_key = os.getenv("BASELINE_ADMIN_KEY", "admin123")
+                            if admin_key == expected_key:
+                                try:
+                                    all_failures = expand_occurrences(result['new_failures'] + result['existing_failures'])
+                                    if selected_project == "UNKNOWN_PROJECT":
+                                        st.error("Please select a project before saving baseline.")
+                                    else:
+                                        baseline_id = baseline_service.save(
+                                            project=selected_project,
+                                            platform="provar",
+                                            failures=all_failures,
+                                            label=baseline_label if baseline_label else None
+                                        )
+                                        github_connection_probe.clear()  # sidebar count changed
+                                        st.success(f"✅ Multi-baseline saved! ID: {baseline_id}")
+                                        baselines = list_baselines(selected_project)
+                                        st.info(f"📊 This project now has {len(baselines)} baseline(s)")
+                                except Exception as e:
+                                    st.error(f"❌ Error: {str(e)}")
+                            else:
+                                st.error("❌ Invalid admin key")
+            else:
+                # Legacy baseline save
+                with col1:
+                    if st.button(f"💾 Save as Baseline", key=f"save_provar_{idx}"):
+                        if not admin_key:
+                            st.error("❌ Admin key required!")
+                        else:
+                            try:
+                                all_failures = expand_occurrences(result['new_failures'] + result['existing_failures'])
+                                if selected_project == "UNKNOWN_PROJECT":
+                                    st.error("Please select a project before saving baseline.")
+                                else:
+                                    baseline_service.save(
+                                        project=selected_project,
+                                        platform="provar",
+                                        failures=all_failures,
+                                        label=None
+                                    )
+                                    github_connection_probe.clear()  # sidebar count changed
+                                    st.success("✅ Provar baseline saved successfully!")
+                            except Exception as e:
+                                st.error(f"❌ Error: {str(e)}")
+                
+                with col2:
+                    if result['baseline_exists']:
+                        st.success("✅ Baseline exists for this project")
+                    else:
+                        st.warning("⚠️ No baseline found")
+            
+            # Export options
+            st.markdown("### 📤 Export Options")
+            
+            if result['new_failures'] or result['existing_failures']:
+                st.download_button(
+                    label="📥 Download as CSV",
+                    data=result_csv(result, result['new_failures'] + result['existing_failures']),
+                    file_name=f"{result['filename']}_failures.csv",
+                    mime="text/csv",
+                    key=f"export_provar_{idx}"
+                )
+
+
+def render_provar_page():
     st.markdown("## 🔍 Upload Provar XML Reports")
     st.markdown("Upload multiple JUnit XML reports from Provar test executions for simultaneous AI-powered analysis")
     
@@ -1106,141 +1701,101 @@ elif current_page == 'provar':
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            for idx, xml_file in enumerate(uploaded_files):
-                status_text.text(f"Processing {xml_file.name}... ({idx + 1}/{len(uploaded_files)})")
+            # Latest-baseline signatures per project - loaded once per click,
+            # not once per uploaded file
+            baseline_sigs_by_project = {}
+            
+            def get_baseline_sigs(project):
+                """(baseline exists, (testcase, error) signatures of the latest baseline)"""
+                if project in baseline_sigs_by_project:
+                    return baseline_sigs_by_project[project]
                 
-                failures = safe_extract_failures(xml_file)
-
-                if failures:
-                    detected_project = None
-                    project_path = failures[0].get("projectCachePath", "")
-                    
-                   # Method 1: Use "project" field from XML if available
-                    if failures[0].get("project") and failures[0].get("project") != "Unknown":
-                        detected_project = failures[0].get("project")
-                        print(f"✅ Project from XML field: {detected_project}")
-                    
-                    # Method 2: Extract from projectCachePath
-                    if not detected_project and project_path:
-                        for known_proj in KNOWN_PROJECTS:
-                            if known_proj in project_path:
-                                detected_project = known_proj
-                                print(f"✅ Project from path: {detected_project}")
-                                break
-                    
-                    # Method 3: Use detect_project helper
-                    if not detected_project:
-                        detected_project = detect_project(project_path, xml_file.name)
-                        print(f"✅ Project from detect_project: {detected_project}")
-                    
-                    # Method 4: Last resort - use filename if meaningful
-                    if not detected_project or detected_project == "UNKNOWN_PROJECT":
-                        filename = xml_file.name.replace(".xml", "")
-                        # Only use filename if it's not a generic pattern
-                        if not (filename.startswith("JUnit") and "(" in filename):
-                            detected_project = filename
-                        else:
-                            detected_project = "UNKNOWN_PROJECT"
-                    
-                    print(f"📁 Final detected project: {detected_project} (from {xml_file.name})")
-                    
-                    # Capture timestamp from first failure
-                    execution_time = failures[0].get("timestamp", "Unknown")
-                    
-
-                    
-                    # Capture timestamp from first failure
-                    execution_time = failures[0].get("timestamp", "Unknown")
-                    
-                    normalized = []
-                    for f in failures:
-                        if f.get("name") != "__NO_FAILURES__":
-                            normalized.append({
-                                "testcase": f["name"],
-                                "testcase_path": f.get("testcase_path", ""),
-                                "error": f["error"],
-                                "details": f["details"],
-                                "source": xml_file.name,
-                                "webBrowserType": f.get("webBrowserType", "Unknown"),
-                                "projectCachePath": shorten_project_cache_path(f.get("projectCachePath", "")),
-                            })
-                    
-                    # -----------------------------------------------------------
-                    # BASELINE COMPARISON LOGIC (FROM OLD APP.PY)
-                    # -----------------------------------------------------------
-                    baseline_exists_flag = False
-                    new_f = []
-                    existing_f = []
-
-                    try:
-                        # Get all baselines for this project from GitHub
-                        github_files = baseline_service.list(
-                            platform="provar",
-                            project=detected_project
+                exists, sigs = False, set()
+                try:
+                    # Get all baselines for this project from GitHub
+                    github_files = load_cached_baselines("provar", project)
+                    if github_files:
+                        exists = True
+                        # Load the latest baseline (files are sorted by timestamp)
+                        baseline_data = baseline_service.load(
+                            github_files[0]['name'],
+                            platform="provar"
                         )
-                        if github_files:
-                            baseline_exists_flag = True
-                            # Load the latest baseline (files are sorted by timestamp)
-                            latest_file = github_files[0]
-                            baseline_data = baseline_service.load(
-                                latest_file['name'],
-                                platform="provar"
+                        if baseline_data:
+                            sigs = {
+                                (b.get('testcase'), b.get('error'))
+                                for b in baseline_data.get('failures', [])
+                            }
+                except Exception as e:
+                    print(f"⚠️ Error loading baseline from GitHub: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    # If error, treat all as new
+                    exists, sigs = False, set()
+                
+                baseline_sigs_by_project[project] = (exists, sigs)
+                return exists, sigs
+            
+            # Each upload is read once - the bytes feed parsing and its content cache.
+            # Read lazily, so only the current file's copy is held at a time
+            uploads = ((xml_file.name, xml_file.getvalue()) for xml_file in uploaded_files)
+            
+            # Analyses of the last click, keyed on content and baseline revision
+            previous_analyses = st.session_state.get("provar_analyses", {})
+            analyses = {}
+            baseline_revision = baseline_service.get_baseline_revision()
+            
+            # Upload totals, counted as results come in
+            total_failures = 0
+            new_failures = 0
+            
+            # Progress is redrawn every ~2% of the batch, not after every file
+            progress_step = max(1, len(uploaded_files) // 50)
+            
+            for idx, (file_name, file_bytes) in enumerate(uploads):
+                if idx % progress_step == 0:
+                    status_text.text(f"Processing {file_name}... ({idx + 1}/{len(uploaded_files)})")
+                
+                # Same content against the same baselines - reuse the last click's analysis
+                analysis_key = (file_name, hashlib.blake2b(file_bytes, digest_size=16).hexdigest(), baseline_revision)
+                result = previous_analyses.get(analysis_key) or analyze_provar_report(file_name, file_bytes, get_baseline_sigs)
+                
+                if result:
+                    analyses[analysis_key] = result
+                    result = dict(result)  # recompare replaces keys on the shown copy only
+                    new_f = result['new_failures']
+                    
+                    # AI analysis of the new failures - batched requests per file,
+                    # shown from the result instead of requested on every rerun
+                    ai_bundle = {}
+                    if use_ai and new_f:
+                        load_ai_modules()
+                        status_text.text(f"🤖 AI analysis of {file_name}... ({idx + 1}/{len(uploaded_files)})")
+                        unique_new = {ai_failure_key(f['testcase'], f['error'], f['details']): f for f in new_f}
+                        # Failed analyses are left out, so their "Run AI analysis" button still shows
+                        ai_bundle = {
+                            key: analysis
+                            for key, analysis in zip(
+                                unique_new,
+                                generate_ai_bundle(list(unique_new.values()), enable_jira_generation, enable_test_improvements)
                             )
-                            if baseline_data and baseline_data.get('failures'):
-                                # Compare with baseline
-                                baseline_failures = baseline_data.get('failures', [])
-                                # Create signature set from baseline
-                                baseline_sigs = set()
-                                for b in baseline_failures:
-                                    sig = f"{b.get('testcase')}|{b.get('error')}"
-                                    baseline_sigs.add(sig)
-                                # Compare current failures
-                                for failure in normalized:
-                                    sig = f"{failure.get('testcase')}|{failure.get('error')}"
-                                    if sig in baseline_sigs:
-                                        existing_f.append(failure)
-                                    else:
-                                        new_f.append(failure)
-                            else:
-                                # Baseline exists but has no failures
-                                new_f = normalized
-                                existing_f = []
-                        else:
-                            # No baseline exists - all failures are new
-                            baseline_exists_flag = False
-                            new_f = normalized
-                            existing_f = []
-                    except Exception as e:
-                        print(f"⚠️ Error loading baseline from GitHub: {e}")
-                        import traceback
-                        traceback.print_exc()
-                        # If error, treat all as new
-                        baseline_exists_flag = False
-                        new_f = normalized
-                        existing_f = []
-                    # -----------------------------------------------------------
+                            if analysis
+                        }
                     
-                    st.session_state.all_results.append({
-                        'filename': xml_file.name,
-                        'project': detected_project,
-                        'new_failures': new_f,
-                        'existing_failures': existing_f,
-                        'new_count': len(new_f),
-                        'existing_count': len(existing_f),
-                        'total_count': len(normalized),
-                        'baseline_exists': baseline_exists_flag,
-                        'execution_time': execution_time
-                    })
+                    result['ai_bundle'] = ai_bundle
+                    st.session_state.all_results.append(result)
+                    total_failures += result['total_count']
+                    new_failures += result['new_count']
                 
-                progress_bar.progress((idx + 1) / len(uploaded_files))
+                if (idx + 1) % progress_step == 0 or idx + 1 == len(uploaded_files):
+                    progress_bar.progress((idx + 1) / len(uploaded_files))
+            
+            st.session_state.provar_analyses = analyses
             
             status_text.text("✅ Analysis complete!")
             progress_bar.empty()
             
             # Update upload statistics
-            total_failures = sum(r['total_count'] for r in st.session_state.all_results)
-            new_failures = sum(r['new_count'] for r in st.session_state.all_results)
-            
             st.session_state.upload_stats = {
                 'count': len(uploaded_files),
                 'total_failures': total_failures,
@@ -1262,24 +1817,31 @@ elif current_page == 'provar':
         # -----------------------------------------------------------
         if st.session_state.all_results:
             
-            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+            multi_baselines = None
+            if MULTI_BASELINE_AVAILABLE and use_multi_baseline:
+                from baseline_engine import list_baselines, get_baseline_stats
+                
+                # One listing and stats per project, shared by all of its files
+                multi_baselines = {
+                    project: (list_baselines(project), get_baseline_stats(project))
+                    for project in {r['project'] for r in st.session_state.all_results}
+                }
+            
+            st.html(DIVIDER_HTML)
             
             # Batch Pattern Analysis
             if 'batch_analysis' in st.session_state and st.session_state.batch_analysis:
-                st.markdown('<div class="ai-feature-box">', unsafe_allow_html=True)
-                st.markdown("## 🧠 AI Batch Pattern Analysis")
-                st.markdown("AI has analyzed all failures together to identify patterns and priorities.")
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-                st.markdown(st.session_state.batch_analysis)
-                st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+                render_batch_analysis(st.session_state.batch_analysis)
+                st.html(DIVIDER_HTML)
             
             st.markdown("## 📊 Overall Summary")
             
-            # Overall statistics
-            total_new = sum(r['new_count'] for r in st.session_state.all_results)
-            total_existing = sum(r['existing_count'] for r in st.session_state.all_results)
-            total_all = sum(r['total_count'] for r in st.session_state.all_results)
+            # Overall statistics - one pass, counts change on recompare
+            total_new = total_existing = total_all = 0
+            for r in st.session_state.all_results:
+                total_new += r['new_count']
+                total_existing += r['existing_count']
+                total_all += r['total_count']
             
             col1, col2, col3, col4 = st.columns(4)
             with col1:
@@ -1294,250 +1856,12 @@ elif current_page == 'provar':
             # Comparison chart
             render_comparison_chart(st.session_state.all_results)
             
-            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+            st.html(DIVIDER_HTML)
             st.markdown("## 📋 Detailed Results by File")
             
             # Individual file results
             for idx, result in enumerate(st.session_state.all_results):
-                formatted_time = format_execution_time(result.get("execution_time", "Unknown"))
-
-                with st.expander(
-                    f"📄 {result['filename']} | ⏰ {formatted_time} — Project: {result['project']}",
-                    expanded=False
-                ):
-                    
-                    # Summary card for this file
-                    render_summary_card(
-                        result['filename'],
-                        result['new_count'],
-                        result['existing_count'],
-                        result['total_count']
-                    )
-                    
-                    st.markdown("---")
-                    
-                    # Multi-baseline selection (if enabled)
-                    if MULTI_BASELINE_AVAILABLE and use_multi_baseline:
-                        st.markdown("### 🎯 Baseline Selection")
-                        baselines = list_baselines(result['project'])
-                        
-                        if baselines:
-                            col1, col2 = st.columns([3, 1])
-                            with col1:
-                                baseline_options = ['Latest'] + [b['id'] for b in baselines]
-                                selected_baseline = st.selectbox(
-                                    "Compare with baseline:",
-                                    options=baseline_options,
-                                    format_func=lambda x: f"Latest ({baselines[0]['label']}) - {baselines[0]['failure_count']} failures" if x == 'Latest' else f"{[b for b in baselines if b['id'] == x][0]['label']} - {[b for b in baselines if b['id'] == x][0]['failure_count']} failures",
-                                    key=f"baseline_select_{idx}"
-                                )
-                            
-                            with col2:
-                                if st.button("🔄 Recompare", key=f"recompare_{idx}"):
-                                    baseline_id = None if selected_baseline == 'Latest' else selected_baseline
-                                    all_failures = result['new_failures'] + result['existing_failures']
-                                    new_f, existing_f = compare_multi_baseline(
-                                        result['project'],
-                                        all_failures,
-                                        baseline_id
-                                    )
-                                    result['new_failures'] = new_f
-                                    result['existing_failures'] = existing_f
-                                    result['new_count'] = len(new_f)
-                                    result['existing_count'] = len(existing_f)
-                                    st.rerun()
-                            
-                            st.info(f"📊 {len(baselines)} baseline(s) available for {result['project']}")
-                            
-                            # Show baseline stats
-                            if baselines:
-                                stats = get_baseline_stats(result['project'])
-                                col1, col2, col3 = st.columns(3)
-                                with col1:
-                                    st.metric("Total Baselines", stats['count'])
-                                with col2:
-                                    st.metric("Latest", stats['latest'][:8] if stats['latest'] else '-')
-                                with col3:
-                                    st.metric("Oldest", stats['oldest'][:8] if stats.get('oldest') else '-')
-                        else:
-                            st.warning(f"⚠️ No baseline found for {result['project']}")
-                        
-                        st.markdown("---")
-
-                    # Tabs for different failure types
-                    tab1, tab2, tab3 = st.tabs(["🆕 New Failures", "♻️ Existing Failures", "⚙️ Actions"])
-                    
-                    with tab1:
-                        if result['new_count'] == 0:
-                            st.success("✅ No new failures detected!")
-                        else:
-                            for i, f in enumerate(result['new_failures']):
-                                with st.expander(f"🆕 {i+1}. {f['testcase']}", expanded=False):
-                                    st.write("**Browser:**", f['webBrowserType'])
-                                    st.markdown("**Path:**")
-                                    st.code(f['testcase_path'], language="text")
-                                    st.error(f"Error: {f['error']}")
-                                    st.markdown("**Error Details (click copy icon):**")
-                                    st.code(f['details'], language="text")
-                                    
-                                    # AI Features
-                                    if use_ai:
-                                        load_ai_modules()
-                                        ai_tabs = []
-                                        if True:
-                                            ai_tabs.append("🤖 AI Analysis")
-                                        if enable_jira_generation:
-                                            ai_tabs.append("📝 Jira Ticket")
-                                        if enable_test_improvements:
-                                            ai_tabs.append("💡 Improvements")
-                                        
-                                        if len(ai_tabs) > 0:
-                                            ai_tab_objects = st.tabs(ai_tabs)
-                                            
-                                            with ai_tab_objects[0]:
-                                                with st.spinner("Analyzing..."):
-                                                    ai_analysis = generate_ai_summary(f['testcase'], f['error'], f['details'])
-                                                    st.info(ai_analysis)
-                                            
-                                            if enable_jira_generation and len(ai_tab_objects) > 1:
-                                                with ai_tab_objects[1]:
-                                                    with st.spinner("Generating Jira ticket..."):
-                                                        jira_content = generate_jira_ticket(
-                                                            f['testcase'], 
-                                                            f['error'], 
-                                                            f['details'],
-                                                            ai_analysis if 'ai_analysis' in locals() else ""
-                                                        )
-                                                        st.markdown(jira_content)
-                                                        st.download_button(
-                                                            "📥 Download Jira Content",
-                                                            jira_content,
-                                                            file_name=f"jira_{f['testcase'][:30]}.txt",
-                                                            key=f"jira_provar_{idx}_{i}"
-                                                        )
-                                            
-                                            if enable_test_improvements and len(ai_tab_objects) > 2:
-                                                with ai_tab_objects[-1]:
-                                                    with st.spinner("Generating improvement suggestions..."):
-                                                        improvements = suggest_test_improvements(
-                                                            f['testcase'],
-                                                            f['error'],
-                                                            f['details']
-                                                        )
-                                                        st.success(improvements)
-                                    
-                                    st.markdown("---")
-                    
-                    with tab2:
-                        if result['existing_count'] == 0:
-                            st.info("ℹ️ No existing failures found in baseline")
-                        else:
-                            st.warning(f"Found {result['existing_count']} known failures")
-                            for i, f in enumerate(result['existing_failures']):
-                                with st.expander(f"♻️ {i+1}. {f['testcase']}", expanded=False):
-                                    st.write("**Browser:**", f['webBrowserType'])
-                                    st.markdown("**Path:**")
-                                    st.code(f['testcase_path'], language="text")
-                                    st.error(f"Error: {f['error']}")
-                                    st.markdown("**Error Details:**")
-                                    st.code(f['details'], language="text")
-                                    st.markdown("---")
-                    
-                    with tab3:
-                        st.markdown("### 🛠️ Baseline Management")
-                        
-                        # Project selection
-                        st.markdown("### 📌 Select Project for Baseline")
-                        project_options = KNOWN_PROJECTS
-                        selected_project = result['project']
-                        if result['project'] == "UNKNOWN_PROJECT":
-                            selected_project = st.selectbox(
-                                "Choose correct project",
-                                options=project_options,
-                                key=f"project_select_{idx}"
-                            )
-                        else:
-                            st.info(f"Detected Project: {result['project']}")
-                        
-                        # Save baseline section
-                        col1, col2 = st.columns(2)
-                        
-                        # Multi-baseline save
-                        if MULTI_BASELINE_AVAILABLE and use_multi_baseline:
-                            with col1:
-                                baseline_label = st.text_input(
-                                    "Baseline Label",
-                                    value="Auto",
-                                    key=f"label_{idx}",
-                                    help="Custom label for this baseline (e.g., Sprint 23, Release 1.5)"
-                                )
-                            
-                            with col2:
-                                if st.button(f"💾 Save as New Baseline", key=f"save_multi_{idx}"):
-                                    if not admin_key:
-                                        st.error("❌ Admin key required!")
-                                    else:
-                                        expected_key = os.getenv("BASELINE_ADMIN_KEY", "admin123")
-                                        if admin_key == expected_key:
-                                            try:
-                                                all_failures = result['new_failures'] + result['existing_failures']
-                                                if selected_project == "UNKNOWN_PROJECT":
-                                                    st.error("Please select a project before saving baseline.")
-                                                else:
-                                                    baseline_id = baseline_service.save(
-                                                        project=selected_project,
-                                                        platform="provar",
-                                                        failures=all_failures,
-                                                        label=baseline_label if baseline_label else None
-                                                    )
-                                                    st.success(f"✅ Multi-baseline saved! ID: {baseline_id}")
-                                                    baselines = list_baselines(selected_project)
-                                                    st.info(f"📊 This project now has {len(baselines)} baseline(s)")
-                                            except Exception as e:
-                                                st.error(f"❌ Error: {str(e)}")
-                                        else:
-                                            st.error("❌ Invalid admin key")
-                        else:
-                            # Legacy baseline save
-                            with col1:
-                                if st.button(f"💾 Save as Baseline", key=f"save_provar_{idx}"):
-                                    if not admin_key:
-                                        st.error("❌ Admin key required!")
-                                    else:
-                                        try:
-                                            all_failures = result['new_failures'] + result['existing_failures']
-                                            if selected_project == "UNKNOWN_PROJECT":
-                                                st.error("Please select a project before saving baseline.")
-                                            else:
-                                                baseline_service.save(
-                                                    project=selected_project,
-                                                    platform="provar",
-                                                    failures=all_failures,
-                                                    label=None
-                                                )
-                                                st.success("✅ Provar baseline saved successfully!")
-                                        except Exception as e:
-                                            st.error(f"❌ Error: {str(e)}")
-                            
-                            with col2:
-                                if result['baseline_exists']:
-                                    st.success("✅ Baseline exists for this project")
-                                else:
-                                    st.warning("⚠️ No baseline found")
-                        
-                        # Export options
-                        st.markdown("### 📤 Export Options")
-                        export_data = pd.DataFrame(result['new_failures'] + result['existing_failures'])
-                        
-                        if not export_data.empty:
-                            csv = export_data.to_csv(index=False)
-                            st.download_button(
-                                label="📥 Download as CSV",
-                                data=csv,
-                                file_name=f"{result['filename']}_failures.csv",
-                                mime="text/csv",
-                                key=f"export_provar_{idx}"
-                            )
+                render_provar_result(result, idx, multi_baselines)
     else:
         # Welcome message when no files uploaded
         st.info("👆 Upload one or more Provar XML files to begin AI-powered analysis")
@@ -1576,7 +1900,371 @@ elif current_page == 'provar':
 # AUTOMATION API REPORTS PAGE
 # ===================================================================
 
-elif current_page == 'automation_api':
+@st.fragment
+def render_api_result(result, idx, api_multi_baselines):
+    """Result card for one AutomationAPI file. A fragment, so a click inside
+    it reruns only this card; Recompare and the multi-baseline save still
+    rerun the whole page"""
+    if API_MULTI_BASELINE_AVAILABLE and use_multi_baseline:
+        from automation_api_baseline_engine import compare_with_baseline as compare_api_baseline_multi
+    
+    with st.expander(
+        f"📄 {result['filename']} — Project: {result['project']} | "
+        f"⏰ {result['timestamp']} | "
+        f"Failures: {result['stats']['total_failures']}",
+        expanded=False
+    ):
+        
+        # Summary metrics
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("🔴 Real Failures", result['stats']['real_failures'])
+        with col2:
+            st.metric("🟡 Skipped", result['stats']['skipped_failures'])
+        with col3:
+            st.metric("📋 Spec Files", result['stats']['unique_specs'])
+        with col4:
+            st.metric("⏱️ Total Time", f"{result['stats']['total_time']}s")
+        
+        st.markdown("---")
+        
+        # ============================================================
+        # BASELINE COMPARISON SUMMARY
+        # ============================================================
+        if result['baseline_exists'] and (result['new_failures'] or result['existing_failures']):
+            st.markdown("### 📊 Baseline Comparison Summary")
+            
+            # Separate new and existing failures by spec
+            spec_groups = api_spec_groups(result)
+            new_by_spec = spec_groups['new']
+            existing_by_spec = spec_groups['existing']
+            
+            # Categorize specs
+            new_specs = spec_groups['new_specs']
+            mixed_specs = spec_groups['mixed_specs']
+            existing_only_specs = spec_groups['existing_only_specs']
+            
+            # Display summary cards
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                st.metric(
+                    "🆕 New Spec Files",
+                    len(new_specs),
+                    help="Spec files that are completely new (not in baseline)"
+                )
+            
+            with col2:
+                st.metric(
+                    "📊 Specs with New Tests",
+                    len(mixed_specs),
+                    help="Spec files with mix of new and existing failures"
+                )
+            
+            with col3:
+                st.metric(
+                    "♻️ Specs with Known Failures",
+                    len(existing_only_specs),
+                    help="Spec files with only existing (baseline) failures"
+                )
+            
+            st.markdown("---")
+            
+            # 🆕 NEW SPEC FILES (completely new)
+            if new_specs:
+                st.markdown("#### 🆕 New Spec Files (Not in Baseline)")
+                st.info(f"These {len(new_specs)} spec file(s) are completely new and were not in the baseline")
+                
+                for spec in new_specs:
+                    failures = new_by_spec[spec]
+                    real_count = len([f for f in failures if not f.get('is_skipped')])
+                    skipped_count = len([f for f in failures if f.get('is_skipped')])
+                    
+                    with st.expander(
+                        f"🆕 {spec} — {len(failures)} failure(s) "
+                        f"(🔴 {real_count} real, 🟡 {skipped_count} skipped)",
+                        expanded=False
+                    ):
+                        # One markdown block per spec, not one per failure
+                        st.markdown("\n\n".join(
+                            f"{'🟡' if failure.get('is_skipped') else '🔴'} **{i+1}. {failure['test_name']}**{occurrence_suffix(failure)}  \n"
+                            f"   Error: `{failure['error_summary']}`  \n"
+                            f"   Time: {failure['execution_time']}s"
+                            for i, failure in enumerate(failures)
+                        ))
+            
+            # 📊 MIXED SPECS (new + existing failures)
+            if mixed_specs:
+                st.markdown("---")
+                st.markdown("#### 📊 Spec Files with New Failures")
+                st.warning(f"These {len(mixed_specs)} spec file(s) have both NEW and EXISTING failures")
+                
+                for spec in mixed_specs:
+                    new_failures_in_spec = new_by_spec.get(spec, [])
+                    existing_failures_in_spec = existing_by_spec.get(spec, [])
+                    
+                    new_real = len([f for f in new_failures_in_spec if not f.get('is_skipped')])
+                    new_skipped = len([f for f in new_failures_in_spec if f.get('is_skipped')])
+                    existing_count = len(existing_failures_in_spec)
+                    
+                    with st.expander(
+                        f"📊 {spec} — 🆕 {len(new_failures_in_spec)} new | ♻️ {existing_count} existing",
+                        expanded=False
+                    ):
+                        # Show NEW failures
+                        st.markdown(f"**🆕 New Failures ({len(new_failures_in_spec)}):**")
+                        st.markdown("\n\n".join(
+                            f"{'🟡' if failure.get('is_skipped') else '🔴'} {i+1}. **{failure['test_name']}**{occurrence_suffix(failure)}  \n"
+                            f"   Error: `{failure['error_summary']}`  \n"
+                            f"   Time: {failure['execution_time']}s"
+                            for i, failure in enumerate(new_failures_in_spec)
+                        ))
+                        
+                        st.markdown("---")
+                        
+                        # Show EXISTING failures (collapsed by default)
+                        with st.expander(f"♻️ View {existing_count} Known Failures", expanded=False):
+                            st.markdown("\n\n".join(
+                                f"{'🟡' if failure.get('is_skipped') else '🔴'} {i+1}. {failure['test_name']}{occurrence_suffix(failure)}  \n"
+                                f"   Error: `{failure['error_summary']}`"
+                                for i, failure in enumerate(existing_failures_in_spec)
+                            ))
+            
+            # ♻️ EXISTING ONLY SPECS
+            if existing_only_specs:
+                st.markdown("---")
+                st.markdown("#### ♻️ Spec Files with Known Failures Only")
+                st.success(f"These {len(existing_only_specs)} spec file(s) have no new failures (all in baseline)")
+                
+                with st.expander(f"View {len(existing_only_specs)} spec(s) with known failures", expanded=False):
+                    st.markdown("\n".join(
+                        f"- **{spec}** — {len(existing_by_spec[spec])} known failure(s)"
+                        for spec in existing_only_specs
+                    ))
+            
+            st.markdown("---")
+        
+        elif result['baseline_exists']:
+            # Baseline exists but no failures
+            st.success("✅ No failures detected! All tests passed.")
+        
+        else:
+            # No baseline exists
+            st.info("ℹ️ No baseline found. All failures are considered new. Save a baseline to track changes.")
+        
+        st.markdown("---")
+        # ============================================================
+        # DETAILED FAILURES DISPLAY (GROUPED BY SPEC)
+        # ============================================================
+        
+        # Display failures grouped by spec
+        grouped_failures = api_spec_groups(result)['all']
+        if grouped_failures:
+            st.markdown("### 📋 All Failures (Grouped by Spec)")
+            
+            for spec_name, spec_failures in grouped_failures.items():
+                # Count real vs skipped failures
+                real_count = sum(1 for f in spec_failures if not f.get('is_skipped', False))
+                skipped_count = len(spec_failures) - real_count
+                
+                # Build header with counts
+                header = f"#####  {spec_name}"
+                if real_count > 0:
+                    header += f" 🔴 {real_count}"
+                if skipped_count > 0:
+                    header += f" 🟡 {skipped_count}"
+                
+                with st.expander(header, expanded=True):
+                    st.caption(f"{len(spec_failures)} failure(s) in this spec")
+                
+                    for i, failure in enumerate(spec_failures):
+                        # Icon based on type
+                        icon = "🟡" if failure['is_skipped'] else "🔴"
+                        
+                        with st.expander(
+                            f"{icon} {i+1}. {failure['test_name']} ({failure['execution_time']}s)",
+                            expanded=False
+                        ):
+                            if failure['is_skipped']:
+                                st.warning("⚠️ Skipped due to previous failure")
+                            
+                            st.markdown(
+                                f"**Test:** {failure['test_name']}\n\n"
+                                f"**Type:** {failure['failure_type']}"
+                            )
+                            
+                            # Error summary
+                            st.error(f"**Error:** {failure['error_summary']}")
+                            
+                            # Full details in expandable section
+                            with st.expander("📋 Full Error Details"):
+                                st.code(failure['error_details'], language="text")
+                            
+                            # Stack trace
+                            if failure['full_stack_trace']:
+                                with st.expander("🔍 Stack Trace"):
+                                    st.code(failure['full_stack_trace'], language="text")
+                            
+                            # AI Features
+                            if use_ai and not failure['is_skipped']:
+                                st.markdown("---")
+                                render_ai_tabs(
+                                    failure['test_name'],
+                                    failure['error_summary'],
+                                    failure['error_details'],
+                                    result.get('ai_bundle', {}),
+                                    key=f"api_{idx}_{hash(spec_name)}_{i}"
+                                )
+                    
+                    st.markdown("---")
+        
+        # ============================================================
+        # BASELINE MANAGEMENT WITH MULTI-BASELINE SUPPORT
+        # ============================================================
+        
+        st.markdown("### 🛠️ Baseline Management")
+        
+        # Check if multi-baseline is available
+        if API_MULTI_BASELINE_AVAILABLE and use_multi_baseline:
+            # Multi-baseline selection interface
+            st.markdown("#### 🎯 Baseline Selection")
+            baselines, baseline_stats = api_multi_baselines[result['project']]
+            
+            if baselines:
+                # Dropdown to select baseline + Recompare button
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    baseline_options = ['Latest'] + [b['id'] for b in baselines]
+                    baselines_by_id = {b['id']: b for b in baselines}
+                    selected_baseline = st.selectbox(
+                        "Compare with baseline:",
+                        options=baseline_options,
+                        format_func=lambda x, by_id=baselines_by_id, latest=baselines[0]: (
+                            f"Latest ({latest['label']}) - {latest['failure_count']} failures" 
+                            if x == 'Latest' 
+                            else f"{by_id[x]['label']} - {by_id[x]['failure_count']} failures"
+                        ),
+                        key=f"api_baseline_select_{idx}"
+                    )
+                
+                with col2:
+                    if st.button("🔄 Recompare", key=f"api_recompare_{idx}"):
+                        baseline_id = None if selected_baseline == 'Latest' else selected_baseline
+                        all_failures_for_compare = result['all_failures']
+                        
+                        # Remove metadata-only records before comparison
+                        real_failures = [f for f in all_failures_for_compare if not f.get("_no_failures")]
+                        
+                        new_f, existing_f = compare_api_baseline_multi(
+                            result['project'],
+                            list(unique_api_failures(real_failures).values()),
+                            baseline_id
+                        )
+                        
+                        # Update result with new comparison
+                        result['new_failures'] = new_f
+                        result['existing_failures'] = existing_f
+                        result.pop('spec_groups', None)  # regrouped on the next render
+                        # Counted per occurrence, like the stats built at analysis time
+                        result['stats']['real_failures'] = occurrence_count(f for f in new_f if not f.get('is_skipped'))
+                        result['stats']['total_failures'] = occurrence_count(new_f) + occurrence_count(existing_f)
+                        st.rerun()
+                
+                # Show baseline statistics
+                st.info(f"📊 {baseline_stats['count']} baseline(s) available for {result['project']}")
+                
+                # Display baseline details
+                with st.expander("📋 Baseline Details", expanded=False):
+                    for i, baseline in enumerate(baselines[:5]):  # Show top 5
+                        label_color = "🟢" if i == 0 else "🟡"
+                        st.markdown(
+                            f"{label_color} **{baseline['label']}** | "
+                            f"Created: {_format_time(baseline['created_at'])} | "
+                            f"Failures: {baseline['failure_count']}"
+                        )
+                    
+                    if len(baselines) > 5:
+                        st.caption(f"... and {len(baselines) - 5} more")
+            
+            else:
+                st.warning("⚠️ No baseline found for " + result['project'])
+            
+            st.markdown("---")
+            
+            # Save new baseline section
+            st.markdown("#### 💾 Save New Baseline")
+            col1, col2 = st.columns([2, 1])
+            
+            with col1:
+                baseline_label = st.text_input(
+                    "Baseline Label (optional)",
+                    value="",
+                    placeholder="e.g., Sprint 24.1, Release 3.2",
+                    key=f"api_baseline_label_{idx}"
+                )
+            
+            with col2:
+                if st.button(f"💾 Save as Baseline", key=f"save_api_{idx}"):
+                    if not admin_key:
+                        st.error("❌ Admin key required!")
+                    else:
+                        try:
+                            # Use multi-baseline save
+                            baseline_id = baseline_service.save(
+                                project=result['project'],
+                                platform="automation_api",
+                                failures=result['all_failures'],
+                                label=baseline_label if baseline_label else None
+                            )
+                            github_connection_probe.clear()  # sidebar count changed
+                            st.success(f"✅ Baseline saved to GitHub as {baseline_id}!")
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Error: {str(e)}")
+                            import traceback
+                            st.code(traceback.format_exc())
+        
+        else:
+            # Legacy single-baseline mode (fallback)
+            st.info("ℹ️ Enable Multi-Baseline in sidebar for advanced baseline management")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button(f"💾 Save as Baseline", key=f"save_api_{idx}"):
+                    if not admin_key:
+                        st.error("❌ Admin key required!")
+                    else:
+                        try:
+                            baseline_service.save(
+                                project=result['project'],
+                                platform="automation_api",
+                                failures=result['all_failures'],
+                                label=None
+                            )
+                            github_connection_probe.clear()  # sidebar count changed
+                            st.success("✅ AutomationAPI baseline saved!")
+                        except Exception as e:
+                            st.error(f"❌ Error: {str(e)}")
+            
+            with col2:
+                if result['baseline_exists']:
+                    st.success("✅ Baseline exists")
+                else:
+                    st.warning("⚠️ No baseline found")
+        
+        # Export options
+        st.markdown("### 📤 Export Options")
+        if result['all_failures']:
+            st.download_button(
+                label="📥 Download as CSV",
+                data=result_csv(result, result['all_failures']),
+                file_name=f"{result['filename']}_failures.csv",
+                mime="text/csv",
+                key=f"export_api_{idx}"
+            )
+
+
+def render_automation_api_page():
     st.markdown("## 🔧 Upload AutomationAPI XML Reports")
     st.markdown("Upload XML reports from AutomationAPI test executions (e.g., Jasmine/Selenium tests)")
     
@@ -1608,11 +2296,58 @@ elif current_page == 'automation_api':
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            for idx, xml_file in enumerate(uploaded_api_files):
-                status_text.text(f"Processing {xml_file.name}... ({idx + 1}/{len(uploaded_api_files)})")
+            # Latest-baseline signatures per project - loaded once per click,
+            # not once per uploaded file
+            baseline_sigs_by_project = {}
+            
+            def get_api_baseline_sigs(project):
+                """(baseline exists, signatures of the latest baseline's failures)"""
+                if project in baseline_sigs_by_project:
+                    return baseline_sigs_by_project[project]
+                
+                exists, sigs = False, frozenset()
+                try:
+                    # Get all baselines for this project from GitHub
+                    github_files = load_cached_baselines("automation_api", project)
+                    if github_files:
+                        exists = True
+                        # Load the latest baseline (files are sorted by timestamp)
+                        baseline_data = baseline_service.load(
+                            github_files[0]['name'],
+                            platform="automation_api"
+                        )
+                        if baseline_data:
+                            sigs = frozenset(
+                                automation_failure_signature(b)
+                                for b in baseline_data.get('failures', [])
+                            )
+                except Exception as e:
+                    print(f"⚠️ Error loading baseline from GitHub: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    # If error, treat all as new
+                    exists, sigs = False, frozenset()
+                
+                baseline_sigs_by_project[project] = (exists, sigs)
+                return exists, sigs
+            
+            # Each upload is read once - the bytes feed parsing and its content cache.
+            # Read lazily, so only the current file's copy is held at a time
+            uploads = ((xml_file.name, xml_file.getvalue()) for xml_file in uploaded_api_files)
+            
+            # Upload totals, counted as results come in
+            total_failures = 0
+            new_failures = 0
+            
+            # Progress is redrawn every ~2% of the batch, not after every file
+            progress_step = max(1, len(uploaded_api_files) // 50)
+            
+            for idx, (file_name, file_bytes) in enumerate(uploads):
+                if idx % progress_step == 0:
+                    status_text.text(f"Processing {file_name}... ({idx + 1}/{len(uploaded_api_files)})")
                 
                 try:
-                    failures = extract_automation_api_failures(xml_file)
+                    failures = _extract_api_failures_cached(file_bytes, file_name)
                     
                     if failures:
                         project = failures[0].get("project", "Unknown")
@@ -1620,96 +2355,69 @@ elif current_page == 'automation_api':
                         # Filter out metadata record
                         real_failures = [f for f in failures if not f.get("_no_failures")]
                         
-                        # Load baseline from GitHub using BaselineService
-                        baseline_exists_flag = False
-                        new_f = []
-                        existing_f = []
-                        
-                        try:
-                            # Get all baselines for this project from GitHub
-                            github_files = baseline_service.list(
-                                platform="automation_api",
-                                project=project
-                            )
-                            if github_files:
-                                baseline_exists_flag = True
-                                # Load the latest baseline (files are sorted by timestamp)
-                                latest_file = github_files[0]
-                                baseline_data = baseline_service.load(
-                                    latest_file['name'],
-                                    platform="automation_api"
-                                )
-                                if baseline_data and baseline_data.get('failures'):
-                                    # Compare with baseline
-                                    baseline_failures = baseline_data.get('failures', [])
-                                    # Create signature set from baseline
-                                    def automation_failure_signature(f):
-                                        interaction = f.get("interaction", {}) or {}
-                                        return "|".join([
-                                            f.get("spec_file", ""),
-                                            f.get("test_name", ""),
-                                            f.get("error_summary", ""),
-                                            str(interaction.get("ActualValue", "")),
-                                            str(interaction.get("ExpectedValue", "")),
-                                        ])
-
-
-                                    baseline_sigs = set()
-                                    for b in baseline_failures:
-                                        baseline_sigs.add(automation_failure_signature(b))
-
-                                    for failure in real_failures:
-                                        sig = automation_failure_signature(failure)
-                                        if sig in baseline_sigs:
-                                            existing_f.append(failure)
-                                        else:
-                                            new_f.append(failure)
-
-                                else:           
-                                    # Baseline exists but has no failures
-                                    new_f = real_failures
-                                    existing_f = []
-                            else:  
-                                # No baseline exists - all failures are new
-                                baseline_exists_flag = False
-                                new_f = real_failures
-                                existing_f = []
-                        except Exception as e:
-                            print(f"⚠️ Error loading baseline from GitHub: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            # If error, treat all as new
-                            baseline_exists_flag = False
-                            new_f = real_failures
+                        # Compare one copy of each failure with the project's latest baseline
+                        unique_failures = unique_api_failures(real_failures)
+                        compared = list(unique_failures.values())
+                        baseline_exists_flag, baseline_sigs = get_api_baseline_sigs(project)
+                        if baseline_sigs and compared:
+                            in_baseline = [sig in baseline_sigs for sig in unique_failures]
+                            existing_f = [f for f, known in zip(compared, in_baseline) if known]
+                            new_f = [f for f, known in zip(compared, in_baseline) if not known]
+                        else:
+                            # No baseline, an empty one, or no failures - nothing to compare
+                            new_f = compared
                             existing_f = []
 
+                        # AI analysis of the real failures - batched per file like Provar
+                        ai_bundle = {}
+                        if use_ai:
+                            ai_failures = {
+                                ai_failure_key(f['test_name'], f['error_summary'], f['error_details']): {
+                                    'testcase': f['test_name'],
+                                    'error': f['error_summary'],
+                                    'details': f['error_details']
+                                }
+                                for f in real_failures if not f.get('is_skipped')
+                            }
+                            if ai_failures:
+                                load_ai_modules()
+                                status_text.text(f"🤖 AI analysis of {file_name}... ({idx + 1}/{len(uploaded_api_files)})")
+                                ai_bundle = {
+                                    key: analysis
+                                    for key, analysis in zip(
+                                        ai_failures,
+                                        generate_ai_bundle(list(ai_failures.values()), enable_jira_generation, enable_test_improvements)
+                                    )
+                                    if analysis
+                                }
+                        
                         # Get statistics
                         stats = get_failure_statistics(real_failures if real_failures else failures)
                         
                         st.session_state.api_results.append({
-                            'filename': xml_file.name,
+                            'filename': file_name,
                             'project': project,
                             'all_failures': real_failures if real_failures else [],
                             'new_failures': new_f,
                             'existing_failures': existing_f,
-                            'grouped_failures': group_failures_by_spec(real_failures) if real_failures else {},
                             'stats': stats,
                             'baseline_exists': baseline_exists_flag,
-                            'timestamp': failures[0].get("timestamp", "Unknown") if failures else "Unknown"
+                            'timestamp': failures[0].get("timestamp", "Unknown") if failures else "Unknown",
+                            'ai_bundle': ai_bundle
                         })
+                        total_failures += stats['total_failures']
+                        new_failures += len(new_f)
                 
                 except Exception as e:
-                    st.error(f"Error parsing {xml_file.name}: {str(e)}")
+                    st.error(f"Error parsing {file_name}: {str(e)}")
                 
-                progress_bar.progress((idx + 1) / len(uploaded_api_files))
+                if (idx + 1) % progress_step == 0 or idx + 1 == len(uploaded_api_files):
+                    progress_bar.progress((idx + 1) / len(uploaded_api_files))
             
             status_text.text("✅ Analysis complete!")
             progress_bar.empty()
             
             # Update stats
-            total_failures = sum(r['stats']['total_failures'] for r in st.session_state.api_results)
-            new_failures = sum(len(r['new_failures']) for r in st.session_state.api_results)
-            
             st.session_state.upload_stats = {
                 'count': len(uploaded_api_files),
                 'total_failures': total_failures,
@@ -1721,13 +2429,28 @@ elif current_page == 'automation_api':
         # -----------------------------------------------------------
         if st.session_state.api_results:
             
-            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+            api_multi_baselines = None
+            if API_MULTI_BASELINE_AVAILABLE and use_multi_baseline:
+                from automation_api_baseline_engine import (
+                    list_baselines as list_api_baselines,
+                    get_baseline_stats as get_api_baseline_stats
+                )
+                
+                # One listing and stats per project, shared by all of its files
+                api_multi_baselines = {
+                    project: (list_api_baselines(project), get_api_baseline_stats(project))
+                    for project in {r['project'] for r in st.session_state.api_results}
+                }
+            
+            st.html(DIVIDER_HTML)
             st.markdown("## 📊 AutomationAPI Analysis Results")
             
-            # Overall statistics
-            total_real = sum(r['stats']['real_failures'] for r in st.session_state.api_results)
-            total_skipped = sum(r['stats']['skipped_failures'] for r in st.session_state.api_results)
-            total_all = sum(r['stats']['total_failures'] for r in st.session_state.api_results)
+            # Overall statistics - one pass, stats change on recompare
+            total_real = total_skipped = total_all = 0
+            for r in st.session_state.api_results:
+                total_real += r['stats']['real_failures']
+                total_skipped += r['stats']['skipped_failures']
+                total_all += r['stats']['total_failures']
             
             col1, col2, col3, col4 = st.columns(4)
             with col1:
@@ -1739,416 +2462,11 @@ elif current_page == 'automation_api':
             with col4:
                 st.metric("📈 Total Failures", total_all)
             
-            st.markdown('<div class="section-divider"></div>', unsafe_allow_html=True)
+            st.html(DIVIDER_HTML)
             
             # Individual file results
             for idx, result in enumerate(st.session_state.api_results):
-                with st.expander(
-                    f"📄 {result['filename']} — Project: {result['project']} | "
-                    f"⏰ {result['timestamp']} | "
-                    f"Failures: {result['stats']['total_failures']}",
-                    expanded=False
-                ):
-                    
-                    # Summary metrics
-                    col1, col2, col3, col4 = st.columns(4)
-                    with col1:
-                        st.metric("🔴 Real Failures", result['stats']['real_failures'])
-                    with col2:
-                        st.metric("🟡 Skipped", result['stats']['skipped_failures'])
-                    with col3:
-                        st.metric("📋 Spec Files", result['stats']['unique_specs'])
-                    with col4:
-                        st.metric("⏱️ Total Time", f"{result['stats']['total_time']}s")
-                    
-                    st.markdown("---")
-                    
-                    # ============================================================
-                    # BASELINE COMPARISON SUMMARY
-                    # ============================================================
-                    if result['baseline_exists'] and (result['new_failures'] or result['existing_failures']):
-                        st.markdown("### 📊 Baseline Comparison Summary")
-                        
-                        # Separate new and existing failures by spec
-                        new_by_spec = {}
-                        existing_by_spec = {}
-                        
-                        for failure in result['new_failures']:
-                            spec = failure.get('spec_file', 'Unknown')
-                            if spec not in new_by_spec:
-                                new_by_spec[spec] = []
-                            new_by_spec[spec].append(failure)
-                        
-                        for failure in result['existing_failures']:
-                            spec = failure.get('spec_file', 'Unknown')
-                            if spec not in existing_by_spec:
-                                existing_by_spec[spec] = []
-                            existing_by_spec[spec].append(failure)
-                        
-                        # Get all unique specs
-                        all_specs = set(new_by_spec.keys()) | set(existing_by_spec.keys())
-                        
-                        # Categorize specs
-                        new_specs = [s for s in new_by_spec.keys() if s not in existing_by_spec]
-                        mixed_specs = [s for s in all_specs if s in new_by_spec and s in existing_by_spec]
-                        existing_only_specs = [s for s in existing_by_spec.keys() if s not in new_by_spec]
-                        
-                        # Display summary cards
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            st.metric(
-                                "🆕 New Spec Files",
-                                len(new_specs),
-                                help="Spec files that are completely new (not in baseline)"
-                            )
-                        
-                        with col2:
-                            st.metric(
-                                "📊 Specs with New Tests",
-                                len(mixed_specs),
-                                help="Spec files with mix of new and existing failures"
-                            )
-                        
-                        with col3:
-                            st.metric(
-                                "♻️ Specs with Known Failures",
-                                len(existing_only_specs),
-                                help="Spec files with only existing (baseline) failures"
-                            )
-                        
-                        st.markdown("---")
-                        
-                        # 🆕 NEW SPEC FILES (completely new)
-                        if new_specs:
-                            st.markdown("#### 🆕 New Spec Files (Not in Baseline)")
-                            st.info(f"These {len(new_specs)} spec file(s) are completely new and were not in the baseline")
-                            
-                            for spec in sorted(new_specs):
-                                failures = new_by_spec[spec]
-                                real_count = len([f for f in failures if not f.get('is_skipped')])
-                                skipped_count = len([f for f in failures if f.get('is_skipped')])
-                                
-                                with st.expander(
-                                    f"🆕 {spec} — {len(failures)} failure(s) "
-                                    f"(🔴 {real_count} real, 🟡 {skipped_count} skipped)",
-                                    expanded=False
-                                ):
-                                    for i, failure in enumerate(failures):
-                                        icon = "🟡" if failure.get('is_skipped') else "🔴"
-                                        st.markdown(
-                                            f"{icon} **{i+1}. {failure['test_name']}**  \n"
-                                            f"   Error: `{failure['error_summary']}`  \n"
-                                            f"   Time: {failure['execution_time']}s"
-                                        )
-                        
-                        # 📊 MIXED SPECS (new + existing failures)
-                        if mixed_specs:
-                            st.markdown("---")
-                            st.markdown("#### 📊 Spec Files with New Failures")
-                            st.warning(f"These {len(mixed_specs)} spec file(s) have both NEW and EXISTING failures")
-                            
-                            for spec in sorted(mixed_specs):
-                                new_failures_in_spec = new_by_spec.get(spec, [])
-                                existing_failures_in_spec = existing_by_spec.get(spec, [])
-                                
-                                new_real = len([f for f in new_failures_in_spec if not f.get('is_skipped')])
-                                new_skipped = len([f for f in new_failures_in_spec if f.get('is_skipped')])
-                                existing_count = len(existing_failures_in_spec)
-                                
-                                with st.expander(
-                                    f"📊 {spec} — 🆕 {len(new_failures_in_spec)} new | ♻️ {existing_count} existing",
-                                    expanded=False
-                                ):
-                                    # Show NEW failures
-                                    st.markdown(f"**🆕 New Failures ({len(new_failures_in_spec)}):**")
-                                    for i, failure in enumerate(new_failures_in_spec):
-                                        icon = "🟡" if failure.get('is_skipped') else "🔴"
-                                        st.markdown(
-                                            f"{icon} {i+1}. **{failure['test_name']}**  \n"
-                                            f"   Error: `{failure['error_summary']}`  \n"
-                                            f"   Time: {failure['execution_time']}s"
-                                        )
-                                    
-                                    st.markdown("---")
-                                    
-                                    # Show EXISTING failures (collapsed by default)
-                                    with st.expander(f"♻️ View {existing_count} Known Failures", expanded=False):
-                                        for i, failure in enumerate(existing_failures_in_spec):
-                                            icon = "🟡" if failure.get('is_skipped') else "🔴"
-                                            st.markdown(
-                                                f"{icon} {i+1}. {failure['test_name']}  \n"
-                                                f"   Error: `{failure['error_summary']}`"
-                                            )
-                        
-                        # ♻️ EXISTING ONLY SPECS
-                        if existing_only_specs:
-                            st.markdown("---")
-                            st.markdown("#### ♻️ Spec Files with Known Failures Only")
-                            st.success(f"These {len(existing_only_specs)} spec file(s) have no new failures (all in baseline)")
-                            
-                            with st.expander(f"View {len(existing_only_specs)} spec(s) with known failures", expanded=False):
-                                for spec in sorted(existing_only_specs):
-                                    failures = existing_by_spec[spec]
-                                    st.markdown(f"- **{spec}** — {len(failures)} known failure(s)")
-                        
-                        st.markdown("---")
-                    
-                    elif result['baseline_exists']:
-                        # Baseline exists but no failures
-                        st.success("✅ No failures detected! All tests passed.")
-                    
-                    else:
-                        # No baseline exists
-                        st.info("ℹ️ No baseline found. All failures are considered new. Save a baseline to track changes.")
-                    
-                    st.markdown("---")
-                    # ============================================================
-                    # DETAILED FAILURES DISPLAY (GROUPED BY SPEC)
-                    # ============================================================
-                    
-                    # Display failures grouped by spec
-                    if result['grouped_failures']:
-                        st.markdown("### 📋 All Failures (Grouped by Spec)")
-                        
-                        for spec_name, spec_failures in result['grouped_failures'].items():
-                            # Count real vs skipped failures
-                            real_count = sum(1 for f in spec_failures if not f.get('is_skipped', False))
-                            skipped_count = len(spec_failures) - real_count
-                            
-                            # Build header with counts
-                            header = f"#####  {spec_name}"
-                            if real_count > 0:
-                                header += f" 🔴 {real_count}"
-                            if skipped_count > 0:
-                                header += f" 🟡 {skipped_count}"
-                            
-                            with st.expander(header, expanded=True):
-                                st.caption(f"{len(spec_failures)} failure(s) in this spec")
-                            
-                                for i, failure in enumerate(spec_failures):
-                                    # Icon based on type
-                                    icon = "🟡" if failure['is_skipped'] else "🔴"
-                                    failure_class = "skipped-failure" if failure['is_skipped'] else "real-failure"
-                                    
-                                    with st.expander(
-                                        f"{icon} {i+1}. {failure['test_name']} ({failure['execution_time']}s)",
-                                        expanded=False
-                                    ):
-                                        st.markdown(f"<div class='{failure_class}'>", unsafe_allow_html=True)
-                                        
-                                        if failure['is_skipped']:
-                                            st.warning("⚠️ Skipped due to previous failure")
-                                        
-                                        st.write("**Test:** ", failure['test_name'])
-                                        st.write("**Type:** ", failure['failure_type'])
-                                        
-                                        # Error summary
-                                        st.error(f"**Error:** {failure['error_summary']}")
-                                        
-                                        # Full details in expandable section
-                                        with st.expander("📋 Full Error Details"):
-                                            st.code(failure['error_details'], language="text")
-                                        
-                                        # Stack trace
-                                        if failure['full_stack_trace']:
-                                            with st.expander("🔍 Stack Trace"):
-                                                st.code(failure['full_stack_trace'], language="text")
-                                        
-                                        # AI Features
-                                        if use_ai and not failure['is_skipped']:
-                                            load_ai_modules()
-                                            st.markdown("---")
-                                            ai_tabs = ["🤖 AI Analysis"]
-                                            if enable_jira_generation:
-                                                ai_tabs.append("📝 Jira Ticket")
-                                            if enable_test_improvements:
-                                                ai_tabs.append("💡 Improvements")
-                                            
-                                            ai_tab_objects = st.tabs(ai_tabs)
-                                            
-                                            with ai_tab_objects[0]:
-                                                with st.spinner("Analyzing..."):
-                                                    ai_analysis = generate_ai_summary(
-                                                        failure['test_name'],
-                                                        failure['error_summary'],
-                                                        failure['error_details']
-                                                    )
-                                                    st.info(ai_analysis)
-                                            
-                                            if enable_jira_generation and len(ai_tab_objects) > 1:
-                                                with ai_tab_objects[1]:
-                                                    with st.spinner("Generating Jira ticket..."):
-                                                        jira_content = generate_jira_ticket(
-                                                            failure['test_name'],
-                                                            failure['error_summary'],
-                                                            failure['error_details'],
-                                                            ai_analysis if 'ai_analysis' in locals() else ""
-                                                        )
-                                                        st.markdown(jira_content)
-                                                        st.download_button(
-                                                            "📥 Download Jira Content",
-                                                            jira_content,
-                                                            file_name=f"jira_{failure['test_name'][:30]}.txt",
-                                                            key=f"jira_api_{idx}_{hash(spec_name)}_{i}"
-                                                        )
-                                            
-                                            if enable_test_improvements and len(ai_tab_objects) > 2:
-                                                with ai_tab_objects[-1]:
-                                                    with st.spinner("Generating improvement suggestions..."):
-                                                        improvements = suggest_test_improvements(
-                                                            failure['test_name'],
-                                                            failure['error_summary'],
-                                                            failure['error_details']
-                                                        )
-                                                        st.success(improvements)
-                                        
-                                        st.markdown("</div>", unsafe_allow_html=True)
-                                
-                                st.markdown("---")
-                    
-                    # ============================================================
-                    # BASELINE MANAGEMENT WITH MULTI-BASELINE SUPPORT
-                    # ============================================================
-                    
-                    st.markdown("### 🛠️ Baseline Management")
-                    
-                    # Check if multi-baseline is available
-                    if API_MULTI_BASELINE_AVAILABLE and use_multi_baseline:
-                        # Multi-baseline selection interface
-                        st.markdown("#### 🎯 Baseline Selection")
-                        baselines = list_api_baselines(result['project'])
-                        
-                        if baselines:
-                            # Dropdown to select baseline + Recompare button
-                            col1, col2 = st.columns([3, 1])
-                            with col1:
-                                baseline_options = ['Latest'] + [b['id'] for b in baselines]
-                                selected_baseline = st.selectbox(
-                                    "Compare with baseline:",
-                                    options=baseline_options,
-                                    format_func=lambda x: (
-                                        f"Latest ({baselines[0]['label']}) - {baselines[0]['failure_count']} failures" 
-                                        if x == 'Latest' 
-                                        else f"{[b for b in baselines if b['id'] == x][0]['label']} - {[b for b in baselines if b['id'] == x][0]['failure_count']} failures"
-                                    ),
-                                    key=f"api_baseline_select_{idx}"
-                                )
-                            
-                            with col2:
-                                if st.button("🔄 Recompare", key=f"api_recompare_{idx}"):
-                                    baseline_id = None if selected_baseline == 'Latest' else selected_baseline
-                                    all_failures_for_compare = result['all_failures']
-                                    
-                                    # Remove metadata-only records before comparison
-                                    real_failures = [f for f in all_failures_for_compare if not f.get("_no_failures")]
-                                    
-                                    new_f, existing_f = compare_api_baseline_multi(
-                                        result['project'],
-                                        real_failures,
-                                        baseline_id
-                                    )
-                                    
-                                    # Update result with new comparison
-                                    result['new_failures'] = new_f
-                                    result['existing_failures'] = existing_f
-                                    result['stats']['real_failures'] = len([f for f in new_f if not f.get('is_skipped')])
-                                    result['stats']['total_failures'] = len(new_f) + len(existing_f)
-                                    st.rerun()
-                            
-                            # Show baseline statistics
-                            stats = get_api_baseline_stats(result['project'])
-                            st.info(f"📊 {stats['count']} baseline(s) available for {result['project']}")
-                            
-                            # Display baseline details
-                            with st.expander("📋 Baseline Details", expanded=False):
-                                for i, baseline in enumerate(baselines[:5]):  # Show top 5
-                                    label_color = "🟢" if i == 0 else "🟡"
-                                    st.markdown(
-                                        f"{label_color} **{baseline['label']}** | "
-                                        f"Created: {_format_time(baseline['created_at'])} | "
-                                        f"Failures: {baseline['failure_count']}"
-                                    )
-                                
-                                if len(baselines) > 5:
-                                    st.caption(f"... and {len(baselines) - 5} more")
-                        
-                        else:
-                            st.warning("⚠️ No baseline found for " + result['project'])
-                        
-                        st.markdown("---")
-                        
-                        # Save new baseline section
-                        st.markdown("#### 💾 Save New Baseline")
-                        col1, col2 = st.columns([2, 1])
-                        
-                        with col1:
-                            baseline_label = st.text_input(
-                                "Baseline Label (optional)",
-                                value="",
-                                placeholder="e.g., Sprint 24.1, Release 3.2",
-                                key=f"api_baseline_label_{idx}"
-                            )
-                        
-                        with col2:
-                            if st.button(f"💾 Save as Baseline", key=f"save_api_{idx}"):
-                                if not admin_key:
-                                    st.error("❌ Admin key required!")
-                                else:
-                                    try:
-                                        # Use multi-baseline save
-                                        baseline_id = baseline_service.save(
-                                            project=result['project'],
-                                            platform="automation_api",
-                                            failures=result['all_failures'],
-                                            label=baseline_label if baseline_label else None
-                                        )
-                                        st.success(f"✅ Baseline saved to GitHub as {baseline_id}!")
-                                        st.rerun()
-                                    except Exception as e:
-                                        st.error(f"❌ Error: {str(e)}")
-                                        import traceback
-                                        st.code(traceback.format_exc())
-                    
-                    else:
-                        # Legacy single-baseline mode (fallback)
-                        st.info("ℹ️ Enable Multi-Baseline in sidebar for advanced baseline management")
-                        
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            if st.button(f"💾 Save as Baseline", key=f"save_api_{idx}"):
-                                if not admin_key:
-                                    st.error("❌ Admin key required!")
-                                else:
-                                    try:
-                                        baseline_service.save(
-                                            project=result['project'],
-                                            platform="automation_api",
-                                            failures=result['all_failures'],
-                                            label=None
-                                        )
-                                        st.success("✅ AutomationAPI baseline saved!")
-                                    except Exception as e:
-                                        st.error(f"❌ Error: {str(e)}")
-                        
-                        with col2:
-                            if result['baseline_exists']:
-                                st.success("✅ Baseline exists")
-                            else:
-                                st.warning("⚠️ No baseline found")
-                    
-                    # Export options
-                    st.markdown("### 📤 Export Options")
-                    if result['all_failures']:
-                        export_data = pd.DataFrame(result['all_failures'])
-                        csv = export_data.to_csv(index=False)
-                        st.download_button(
-                            label="📥 Download as CSV",
-                            data=csv,
-                            file_name=f"{result['filename']}_failures.csv",
-                            mime="text/csv",
-                            key=f"export_api_{idx}"
-                        )
+                render_api_result(result, idx, api_multi_baselines)
 
     else:
         # Welcome message when no files uploaded
@@ -2186,4 +2504,17 @@ elif current_page == 'automation_api':
 
 # ===================================================================
 # END OF AUTOMATION API REPORTS PAGE
-# ===================================================================
\ No newline at end of file
+# ===================================================================
+
+# Only the selected page's function runs, so page-only imports stay inside it
+PAGE_RENDERERS = {
+    'dashboard': render_dashboard_page,
+    'baselines': render_baselines_page,
+    'settings': render_settings_page,
+    'provar': render_provar_page,
+    'automation_api': render_automation_api_page,
+}
+
+render_page = PAGE_RENDERERS.get(current_page)
+if render_page:
+    render_page()
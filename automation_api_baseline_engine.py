@@ -6,7 +6,9 @@ Separate from Provar baselines, stores up to 10 baselines per project
 
 import os
 import json
+import copy
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Optional
 
 # -------------------------------------------------
@@ -105,32 +107,54 @@ def load_baseline(project: str, baseline_id: str) -> Optional[Dict]:
 
 def list_baselines(project: str) -> List[Dict]:
     """
-    Returns list of all baselines for a project, sorted newest → oldest
+    Returns list of all baselines for a project, sorted newest → oldest.
+    The parsed files are cached, so these are copies - callers may change
+    them without affecting later calls.
     """
+    return copy.deepcopy(list(_cached_baselines(project)))
+
+
+def _cached_baselines(project: str):
+    """Cached baselines of a project, newest first - shared, never modify them"""
     path = _project_dir(project)
-    baselines = []
 
     if not os.path.exists(path):
-        return []
+        return ()
+
+    return _load_baselines(path, _baseline_files(path))
+
+
+def _baseline_files(path: str):
+    """(name, mtime, size) of each baseline file - a cheap key that changes on any save/delete"""
+    return tuple(sorted(
+        (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+        for entry in os.scandir(path)
+        if entry.name.endswith(".json")
+    ))
+
 
-    for f in os.listdir(path):
-        if f.endswith(".json"):
-            try:
-                with open(os.path.join(path, f), encoding="utf-8") as jf:
-                    baseline = json.load(jf)
-                    if "id" in baseline and "created_at" in baseline:
-                        baselines.append(baseline)
-            except Exception as e:
-                print(f"Error loading baseline file {f}: {e}")
-                continue
+@lru_cache(maxsize=128)
+def _load_baselines(path: str, files: tuple):
+    """Parse a project's baseline files - re-read only when the files change"""
+    baselines = []
+
+    for f, _, _ in files:
+        try:
+            with open(os.path.join(path, f), encoding="utf-8") as jf:
+                baseline = json.load(jf)
+                if "id" in baseline and "created_at" in baseline:
+                    baselines.append(baseline)
+        except Exception as e:
+            print(f"Error loading baseline file {f}: {e}")
+            continue
 
-    return sorted(baselines, key=lambda x: x["created_at"], reverse=True)
+    return tuple(sorted(baselines, key=lambda x: x["created_at"], reverse=True))
 
 
 def get_latest_baseline(project: str) -> Optional[Dict]:
     """Get the most recent baseline for a project"""
-    baselines = list_baselines(project)
-    return baselines[0] if baselines else None
+    baselines = _cached_baselines(project)
+    return copy.deepcopy(baselines[0]) if baselines else None
 
 
 def delete_baseline(project: str, baseline_id: str) -> bool:
@@ -148,7 +172,7 @@ def delete_baseline(project: str, baseline_id: str) -> bool:
 
 def get_baseline_stats(project: str) -> Dict:
     """Get statistics about baselines for a project"""
-    baselines = list_baselines(project)
+    baselines = _cached_baselines(project)
     return {
         "count": len(baselines),
         "latest": baselines[0]["created_at"] if baselines else None,
@@ -157,47 +181,52 @@ def get_baseline_stats(project: str) -> Dict:
     }
 
 
+def _failure_key(failure: Dict) -> tuple:
+    """Comparison key of a failure: (spec_file, test_name, error_summary)"""
+    return (
+        failure.get('spec_file', ''),
+        failure.get('test_name', ''),
+        failure.get('error_summary', ''),
+    )
+
+
+@lru_cache(maxsize=128)
+def _load_baseline_keys(project: str, files: tuple, baseline_id: Optional[str]):
+    """Failure keys of a baseline (latest if no id) - rebuilt only when the files change.
+    None if the baseline doesn't exist."""
+    baselines = _load_baselines(_project_dir(project), files)
+    if baseline_id:
+        baseline = next((b for b in baselines if b["id"] == baseline_id), None)
+        if baseline is None:
+            # Not in the listing (e.g. no created_at) - read the file itself
+            baseline = load_baseline(project, baseline_id)
+    else:
+        baseline = baselines[0] if baselines else None
+
+    if not baseline:
+        return None
+    return frozenset(_failure_key(f) for f in baseline.get("failures", []))
+
+
 def compare_with_baseline(project: str, current_failures: list, baseline_id: str = None):
     """
     Compare current failures with a baseline (latest if not specified).
-    Uses: spec_file|test_name|error_summary for matching
+    Uses: (spec_file, test_name, error_summary) for matching
     Returns (new_failures, existing_failures)
     """
-    if baseline_id:
-        baseline = load_baseline(project, baseline_id)
-    else:
-        baseline = get_latest_baseline(project)
+    baseline_keys = _load_baseline_keys(project, _baseline_files(_project_dir(project)), baseline_id)
     
-    if not baseline:
-        # Filter out metadata records
-        real_failures = [f for f in current_failures if not f.get("_no_failures")]
-        return real_failures, []
+    # Filter out metadata records
+    real_failures = [f for f in current_failures if not f.get("_no_failures")]
     
-    baseline_failures = baseline.get("failures", [])
-    
-    # Create keys for comparison (spec_file|test_name|error_summary)
-    baseline_keys = set()
-    for f in baseline_failures:
-        spec = f.get('spec_file', '')
-        test = f.get('test_name', '')
-        error = f.get('error_summary', '')
-        sig = f"{spec}|{test}|{error}"
-        baseline_keys.add(sig)
+    if baseline_keys is None:
+        return real_failures, []
     
     new_failures = []
     existing_failures = []
     
-    for failure in current_failures:
-        # Skip metadata records
-        if failure.get("_no_failures"):
-            continue
-        
-        spec = failure.get('spec_file', '')
-        test = failure.get('test_name', '')
-        error = failure.get('error_summary', '')
-        sig = f"{spec}|{test}|{error}"
-        
-        if sig in baseline_keys:
+    for failure in real_failures:
+        if _failure_key(failure) in baseline_keys:
             existing_failures.append(failure)
         else:
             new_failures.append(failure)
@@ -221,7 +250,7 @@ def get_all_projects() -> List[str]:
 
 def baseline_exists(project: str) -> bool:
     """Check if any baseline exists for a project"""
-    baselines = list_baselines(project)
+    baselines = _cached_baselines(project)
     return len(baselines) > 0
 
 
@@ -233,7 +262,7 @@ def _enforce_limit(project: str):
     Ensure no more than MAX_BASELINES_PER_PROJECT baselines exist.
     Deletes oldest baselines if limit exceeded.
     """
-    baselines = list_baselines(project)
+    baselines = _cached_baselines(project)
     if len(baselines) <= MAX_BASELINES_PER_PROJECT:
         return
 
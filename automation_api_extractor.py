@@ -1,4 +1,5 @@
 import xml.etree.ElementTree as ET
+from collections import defaultdict
 from typing import List, Dict
 import re
 def extract_spec_from_testsuite(testsuite_node) -> str:
@@ -117,76 +118,119 @@ def clean_error_message(raw_message: str) -> tuple:
     return (summary, raw_message)
 
 
+def _failure_record(spec_name: str, testcase, failure, source: str) -> Dict:
+    """
+    Build the failure dict for one failed testcase.
+    project and timestamp are filled in once the whole report is read.
+    """
+    classname = testcase.attrib.get("classname", "Unknown")
+    test_name = testcase.attrib.get("name", "Unknown Test")
+    test_time = testcase.attrib.get("time", "0")
+
+    # Get failure details
+    failure_type = failure.attrib.get("type", "exception")
+    raw_message = failure.attrib.get("message", "")
+    full_details = failure.text or ""
+
+    # Determine if this is a skipped failure
+    is_skipped = is_skipped_failure(raw_message) or is_skipped_failure(full_details)
+
+    # Clean error message
+    error_summary, error_details = clean_error_message(raw_message)
+
+    return {
+        "project": None,
+        "spec_file": spec_name,
+        "test_name": test_name,
+        "classname": classname,
+        "error_summary": error_summary,
+        "error_details": error_details,
+        "full_stack_trace": full_details,
+        "failure_type": failure_type,
+        "execution_time": test_time,
+        "is_skipped": is_skipped,
+        "timestamp": None,
+        "source": source
+    }
+
+
 def extract_automation_api_failures(xml_file) -> List[Dict]:
     """
     Extract failures from AutomationAPI XML report.
     Returns list of failures grouped by spec file.
+
+    The report is streamed: each testsuite is resolved when it closes
+    and then dropped, so only one suite is ever held in memory.
     """
     xml_file.seek(0)
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
-    # Extract project name
-    project_name = extract_project_name(xml_file)
-    xml_file.seek(0)  # Reset for re-parsing
-    
-    # Get timestamp
-    timestamp = root.attrib.get("timestamp", "Unknown")
-    for suite in root.findall("testsuite"):
-        if suite.attrib.get("timestamp"):
-            timestamp = suite.attrib.get("timestamp")
-            break
-    
+    source = xml_file.name if hasattr(xml_file, 'name') else "uploaded_file.xml"
+
+    root = None
+    project_name = None
+    timestamp = None
+    open_elems = []  # ancestors of the current element
+    suite_order = {}  # open testsuite element -> position in document order
+    suites_seen = 0
+    suite_failures = []  # (position, failures) per parsed testsuite
+
+    for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            elif elem.tag == "testsuite":
+                suite_order[elem] = suites_seen
+                suites_seen += 1
+                # Timestamp comes from the first top-level suite that has one
+                if timestamp is None and len(open_elems) == 1 and elem.attrib.get("timestamp"):
+                    timestamp = elem.attrib.get("timestamp")
+            open_elems.append(elem)
+            continue
+
+        open_elems.pop()
+
+        if elem.tag == "testcase":
+            # Project name: Jenkins workspace path in the first failure that has one
+            failure = elem.find("failure")
+            if project_name is None and failure is not None:
+                match = re.search(r'workspace[/\\]([^/\\]+)', failure.text or "")
+                if match:
+                    project_name = match.group(1)
+            # Testcases outside a suite are never reported, drop them now
+            if open_elems and (open_elems[-1].tag != "testsuite" or open_elems[-1] is root):
+                open_elems[-1].remove(elem)
+            continue
+
+        if elem.tag != "testsuite" or elem is root:
+            continue
+
+        suite_name = elem.attrib.get("name", "Unknown")
+        suite_position = suite_order.pop(elem)
+        # Skip non-test suites (like "Launch Provar", "Screen Recording", etc.)
+        if suite_name not in ["Launch Provar", "Screen Recording", "Close Provar"]:
+            # ✅ Resolve correct spec ONCE per testsuite
+            resolved_spec_name = extract_spec_from_testsuite(elem)
+            suite_failures.append((suite_position, [
+                _failure_record(resolved_spec_name, testcase, failure, source)
+                for testcase in elem.findall("testcase")
+                for failure in [testcase.find("failure")]
+                if failure is not None
+            ]))
+        open_elems[-1].remove(elem)
+
+    # Project and timestamp are only known once the whole report is read
+    project_name = project_name or "Unknown_Project"
+    if timestamp is None:
+        timestamp = root.attrib.get("timestamp", "Unknown")
+
     # Get total stats
     total_tests = int(root.attrib.get("tests", 0))
-    total_failures = int(root.attrib.get("failures", 0))
-    
-    failures = []
-    
-    # Parse all testsuites
-    for testsuite in root.findall(".//testsuite"):
-        suite_name = testsuite.attrib.get("name", "Unknown")
-        # ✅ Resolve correct spec ONCE per testsuite
-        resolved_spec_name = extract_spec_from_testsuite(testsuite)
 
-        # Skip non-test suites (like "Launch Provar", "Screen Recording", etc.)
-        if suite_name in ["Launch Provar", "Screen Recording", "Close Provar"]:
-            continue
-        
-        # Parse testcases in this suite
-        for testcase in testsuite.findall("testcase"):
-            failure = testcase.find("failure")
-            
-            if failure is not None:
-                spec_name = resolved_spec_name
-                classname = testcase.attrib.get("classname", "Unknown")
-                test_name = testcase.attrib.get("name", "Unknown Test")
-                test_time = testcase.attrib.get("time", "0")
-                
-                # Get failure details
-                failure_type = failure.attrib.get("type", "exception")
-                raw_message = failure.attrib.get("message", "")
-                full_details = failure.text or ""
-                
-                # Determine if this is a skipped failure
-                is_skipped = is_skipped_failure(raw_message) or is_skipped_failure(full_details)
-                
-                # Clean error message
-                error_summary, error_details = clean_error_message(raw_message)
-                
-                failures.append({
-                    "project": project_name,
-                    "spec_file": spec_name,
-                    "test_name": test_name,
-                    "classname": classname,
-                    "error_summary": error_summary,
-                    "error_details": error_details,
-                    "full_stack_trace": full_details,
-                    "failure_type": failure_type,
-                    "execution_time": test_time,
-                    "is_skipped": is_skipped,
-                    "timestamp": timestamp,
-                    "source": xml_file.name if hasattr(xml_file, 'name') else "uploaded_file.xml"
-                })
+    # Suites close innermost-first; restore document order
+    suite_failures.sort(key=lambda item: item[0])
+    failures = [failure for _, suite_items in suite_failures for failure in suite_items]
+    for failure in failures:
+        failure["project"] = project_name
+        failure["timestamp"] = timestamp
     
     # If no failures found, return metadata-only record
     if not failures:
@@ -202,7 +246,7 @@ def extract_automation_api_failures(xml_file) -> List[Dict]:
             "execution_time": "0",
             "is_skipped": False,
             "timestamp": timestamp,
-            "source": xml_file.name if hasattr(xml_file, 'name') else "uploaded_file.xml",
+            "source": source,
             "_no_failures": True,
             "total_tests": total_tests,
             "total_failures": 0
@@ -216,15 +260,12 @@ def group_failures_by_spec(failures: List[Dict]) -> Dict[str, List[Dict]]:
     Group failures by spec file for better organization.
     Returns: {spec_name: [list of failures]}
     """
-    grouped = {}
+    grouped = defaultdict(list)
     
     for failure in failures:
-        spec = failure["spec_file"]
-        if spec not in grouped:
-            grouped[spec] = []
-        grouped[spec].append(failure)
+        grouped[failure["spec_file"]].append(failure)
     
-    return grouped
+    return dict(grouped)
 
 
 def get_failure_statistics(failures: List[Dict]) -> Dict:
@@ -1,6 +1,8 @@
 import os
 import json
+import copy
 from datetime import datetime
+from functools import lru_cache
 
 # -------------------------------------------------
 # CONFIGURATION
@@ -78,33 +80,55 @@ def load_baseline(project: str, baseline_id: str):
 
 def list_baselines(project: str):
     """
-    Returns list of all baselines for a project, sorted newest → oldest
+    Returns list of all baselines for a project, sorted newest → oldest.
+    The parsed files are cached, so these are copies - callers may change
+    them without affecting later calls.
     """
+    return copy.deepcopy(list(_cached_baselines(project)))
+
+
+def _cached_baselines(project: str):
+    """Cached baselines of a project, newest first - shared, never modify them"""
     path = _project_dir(project)
-    baselines = []
 
     if not os.path.exists(path):
-        return []
+        return ()
+
+    return _load_baselines(path, _baseline_files(path))
+
 
-    for f in os.listdir(path):
-        if f.endswith(".json"):
-            try:
-                with open(os.path.join(path, f), encoding="utf-8") as jf:
-                    baseline = json.load(jf)
-                    # Ensure all required fields exist
-                    if "id" in baseline and "created_at" in baseline:
-                        baselines.append(baseline)
-            except Exception as e:
-                print(f"Error loading baseline file {f}: {e}")
-                continue
+def _baseline_files(path: str):
+    """(name, mtime, size) of each baseline file - a cheap key that changes on any save/delete"""
+    return tuple(sorted(
+        (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+        for entry in os.scandir(path)
+        if entry.name.endswith(".json")
+    ))
+
+
+@lru_cache(maxsize=128)
+def _load_baselines(path: str, files: tuple):
+    """Parse a project's baseline files - re-read only when the files change"""
+    baselines = []
+
+    for f, _, _ in files:
+        try:
+            with open(os.path.join(path, f), encoding="utf-8") as jf:
+                baseline = json.load(jf)
+                # Ensure all required fields exist
+                if "id" in baseline and "created_at" in baseline:
+                    baselines.append(baseline)
+        except Exception as e:
+            print(f"Error loading baseline file {f}: {e}")
+            continue
 
-    return sorted(baselines, key=lambda x: x["created_at"], reverse=True)
+    return tuple(sorted(baselines, key=lambda x: x["created_at"], reverse=True))
 
 
 def get_latest_baseline(project: str):
     """Get the most recent baseline for a project"""
-    baselines = list_baselines(project)
-    return baselines[0] if baselines else None
+    baselines = _cached_baselines(project)
+    return copy.deepcopy(baselines[0]) if baselines else None
 
 
 def delete_baseline(project: str, baseline_id: str):
@@ -122,7 +146,7 @@ def delete_baseline(project: str, baseline_id: str):
 
 def get_baseline_stats(project: str):
     """Get statistics about baselines for a project"""
-    baselines = list_baselines(project)
+    baselines = _cached_baselines(project)
     return {
         "count": len(baselines),
         "latest": baselines[0]["created_at"] if baselines else None,
@@ -139,7 +163,9 @@ def compare_with_baseline(project: str, current_failures: list, baseline_id: str
     if baseline_id:
         baseline = load_baseline(project, baseline_id)
     else:
-        baseline = get_latest_baseline(project)
+        # Only read here, so the cached copy will do
+        baselines = _cached_baselines(project)
+        baseline = baselines[0] if baselines else None
     
     if not baseline:
         return current_failures, []
@@ -181,7 +207,7 @@ def get_all_projects():
 
 def baseline_exists(project: str):
     """Check if any baseline exists for a project"""
-    baselines = list_baselines(project)
+    baselines = _cached_baselines(project)
     return len(baselines) > 0
 
 
@@ -193,7 +219,7 @@ def _enforce_limit(project: str):
     Ensure no more than MAX_BASELINES_PER_PROJECT baselines exist.
     Deletes oldest baselines if limit exceeded.
     """
-    baselines = list_baselines(project)
+    baselines = _cached_baselines(project)
     if len(baselines) <= MAX_BASELINES_PER_PROJECT:
         return
 
@@ -242,6 +242,14 @@ def render_baseline_tracker_dashboard():
 
     st.markdown("---")
 
+    # One tree request lists both platform folders; fall back per folder
+    baseline_tree = github.list_baseline_tree()
+
+    def list_platform_files(platform: str) -> List[Dict]:
+        if baseline_tree is not None:
+            return baseline_tree.get(platform, [])
+        return github.list_baselines(folder=f"baselines/{platform}")
+
     # Create tabs for Provar and AutomationAPI
     tab_objects = st.tabs(["🔧 Provar Baselines", "⚙️ AutomationAPI Baselines"])
 
@@ -253,7 +261,7 @@ def render_baseline_tracker_dashboard():
         
         try:
             # Load from GitHub
-            provar_files = github.list_baselines(folder="baselines/provar")
+            provar_files = list_platform_files("provar")
             
             if not provar_files:
                 st.info("ℹ️ No Provar baselines have been saved yet. Upload and save Provar XML reports to create baselines.")
@@ -335,7 +343,7 @@ def render_baseline_tracker_dashboard():
         
         try:
             # Load from GitHub
-            api_files = github.list_baselines(folder="baselines/automation_api")
+            api_files = list_platform_files("automation_api")
             
             if not api_files:
                 st.info("ℹ️ No AutomationAPI baselines have been saved yet. Upload and save AutomationAPI XML reports to create baselines.")
@@ -202,7 +202,69 @@ class GitHubStorage:
         except Exception as e:
             print(f"❌ Exception while listing baselines: {str(e)}")
             return []
-    
+
+    def list_baseline_tree(self, folder: str = "baselines") -> Optional[Dict[str, List[Dict[str, str]]]]:
+        """
+        List baseline files of every platform with a single git tree request,
+        instead of one contents request per platform folder
+
+        Args:
+            folder: Root baseline folder in repo (default: 'baselines')
+
+        Returns:
+            {platform: [file info, same shape as list_baselines]}, or None if
+            the tree could not be read in one go (caller should fall back to
+            list_baselines per folder)
+        """
+        try:
+            url = (
+                f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}"
+                f"/git/trees/{self.branch}?recursive=1"
+            )
+
+            print(f"📋 Listing baseline tree: {folder}")
+
+            response = requests.get(url, headers=self.headers)
+
+            if response.status_code != 200:
+                print(f"⚠️ Could not list baseline tree: HTTP {response.status_code}")
+                return None
+
+            data = response.json()
+            if data.get('truncated'):
+                # Tree too large for one response - per-folder listing is complete
+                print("⚠️ Baseline tree truncated, listing per folder instead")
+                return None
+
+            prefix = f"{folder}/"
+            grouped = {}
+
+            for entry in data.get('tree', []):
+                path = entry['path']
+                if entry['type'] != 'blob' or not path.startswith(prefix):
+                    continue
+
+                # Only direct children of a platform folder, like list_baselines
+                parts = path[len(prefix):].split('/')
+                if len(parts) != 2:
+                    continue
+
+                platform, name = parts
+                if name.endswith('.xml') or name.endswith('.json'):
+                    grouped.setdefault(platform, []).append({
+                        'name': name,
+                        'size': entry.get('size', 0),
+                        'url': f"https://github.com/{self.repo_owner}/{self.repo_name}/blob/{self.branch}/{path}",
+                        'download_url': f"https://raw.githubusercontent.com/{self.repo_owner}/{self.repo_name}/{self.branch}/{path}"
+                    })
+
+            print(f"✅ Found {sum(len(files) for files in grouped.values())} baseline(s) in tree")
+            return grouped
+
+        except Exception as e:
+            print(f"❌ Exception while listing baseline tree: {str(e)}")
+            return None
+
     def delete_baseline(
         self, 
         filename: str, 
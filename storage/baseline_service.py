@@ -5,9 +5,64 @@ Falls back to GitHub only when cache misses occur
 """
 
 import json
+import threading
+import time
 import streamlit as st
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Tuple
+
+# Parallel GitHub downloads - kept modest to stay clear of API abuse limits
+MAX_DOWNLOAD_WORKERS = 8
+
+# One download pool for the process, not a new pool per batch. Separate from
+# the app's background executor, so a sync running there can wait on it.
+_DOWNLOAD_POOL = ThreadPoolExecutor(
+    max_workers=MAX_DOWNLOAD_WORKERS,
+    thread_name_prefix="baseline-download"
+)
+
+# Downloaded baseline files, shared by all sessions. A plain dict + lock rather
+# than st.cache_data: downloads also run on worker threads, which have no
+# Streamlit script context. Bounded LRU with a TTL - another process (or a
+# second save in the same second) can rewrite a file, and _forget_file only
+# sees deletes made here. Cached dicts are shared: treat them as read-only.
+FILE_CACHE_MAX_ENTRIES = 256
+FILE_CACHE_TTL_SECONDS = 300
+
+_FILE_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, Dict]]" = OrderedDict()
+_FILE_CACHE_LOCK = threading.Lock()
+
+
+def _load_from_github(github, folder: str, filename: str) -> Dict:
+    """Download and parse one baseline file - cached across sessions"""
+    key = (folder, filename)
+    with _FILE_CACHE_LOCK:
+        entry = _FILE_CACHE.get(key)
+        if entry and time.monotonic() - entry[0] < FILE_CACHE_TTL_SECONDS:
+            _FILE_CACHE.move_to_end(key)
+            return entry[1]
+        _FILE_CACHE.pop(key, None)
+    
+    content = github.load_baseline(filename, folder=folder)
+    if not content:
+        # Raise so a miss is not cached
+        raise FileNotFoundError(f"{folder}/{filename}")
+    data = json.loads(content)
+    
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE[key] = (time.monotonic(), data)
+        _FILE_CACHE.move_to_end(key)
+        while len(_FILE_CACHE) > FILE_CACHE_MAX_ENTRIES:
+            _FILE_CACHE.popitem(last=False)
+    return data
+
+
+def _forget_file(folder: str, filename: str):
+    """Drop a saved or deleted baseline file from the shared file cache"""
+    with _FILE_CACHE_LOCK:
+        _FILE_CACHE.pop((folder, filename), None)
 
 
 class BaselineService:
@@ -41,7 +96,9 @@ class BaselineService:
                 'metadata': {
                     'last_sync': None,
                     'is_synced': False,
-                    'sync_count': 0
+                    'sync_count': 0,
+                    'version': 0,       # bumped on every cache change
+                    'revision': 0       # bumped when baselines are saved, deleted or synced
                 }
             }
             print("🆕 Initialized baseline cache in session_state")
@@ -53,12 +110,36 @@ class BaselineService:
     def _set_cache(self, platform: str, filename: str, data: Dict):
         """Store data in cache"""
         st.session_state.baseline_cache[platform][filename] = data
+        self._bump_version()
         print(f"💾 Cached: {filename}")
     
     def _update_metadata(self, **kwargs):
         """Update cache metadata"""
         st.session_state.baseline_cache['metadata'].update(kwargs)
     
+    def _bump_version(self):
+        """Mark the cache as changed so views derived from it are rebuilt"""
+        metadata = st.session_state.baseline_cache['metadata']
+        metadata['version'] = metadata.get('version', 0) + 1
+    
+    def get_cache_version(self) -> int:
+        """Version of the cache - changes whenever a baseline is added or removed"""
+        return st.session_state.baseline_cache['metadata'].get('version', 0)
+    
+    def _bump_revision(self):
+        """Mark the set of baselines as changed (not bumped by read-through loads)"""
+        metadata = st.session_state.baseline_cache['metadata']
+        metadata['revision'] = metadata.get('revision', 0) + 1
+    
+    def get_baseline_revision(self) -> int:
+        """
+        Revision of the baselines - changes only when baselines are saved,
+        deleted, synced or the cache is cleared. Loading a file into the
+        cache on a miss doesn't change it, so results compared against the
+        baselines can be reused across those loads.
+        """
+        return st.session_state.baseline_cache['metadata'].get('revision', 0)
+    
     # ====================================================================
     # SAVE - Dual Storage (Session State + GitHub)
     # ====================================================================
@@ -103,6 +184,7 @@ class BaselineService:
         # 1️⃣ SAVE TO SESSION STATE (INSTANT)
         try:
             self._set_cache(platform, filename, payload)
+            self._bump_revision()
             print(f"✅ Saved to cache: {filename}")
         except Exception as e:
             print(f"⚠️ Cache save failed: {e}")
@@ -124,6 +206,10 @@ class BaselineService:
             print(f"❌ GitHub save failed: {e}")
             raise Exception(f"Failed to save baseline to GitHub: {str(e)}")
         
+        finally:
+            # A save in the same second reuses the filename - never serve the old copy
+            _forget_file(folder, filename)
+        
         return baseline_id
     
     # ====================================================================
@@ -156,20 +242,69 @@ class BaselineService:
         folder = f"baselines/{platform}"
         
         try:
-            content = self.github.load_baseline(filename, folder=folder)
-            
-            if content:
-                data = json.loads(content)
-                # Cache it for next time
-                self._set_cache(platform, filename, data)
-                return data
-            
+            data = _load_from_github(self.github, folder, filename)
+            # Cache it for next time
+            self._set_cache(platform, filename, data)
+            return data
+        
+        except FileNotFoundError:
             return None
         
         except Exception as e:
             print(f"❌ Failed to load baseline: {e}")
             return None
     
+    def load_many(
+        self,
+        filenames: Iterable[str],
+        platform: str
+    ) -> Dict[str, Dict]:
+        """
+        Load several baselines - cache hits directly, misses from GitHub in parallel
+        
+        Args:
+            filenames: Names of the baseline files
+            platform: "provar" or "automation_api"
+        
+        Returns:
+            {filename: baseline_data} for every baseline that could be loaded
+        """
+        cache = self._get_cache(platform)
+        loaded = {}
+        missing = []
+        
+        for filename in filenames:
+            if filename in cache:
+                loaded[filename] = cache[filename]
+            else:
+                missing.append(filename)
+        
+        if missing:
+            print(f"🌐 Cache miss, loading {len(missing)} baseline(s) from GitHub")
+            downloaded = self._download_many(f"baselines/{platform}", missing)
+            for filename, data in downloaded.items():
+                self._set_cache(platform, filename, data)
+            loaded.update(downloaded)
+        
+        return loaded
+    
+    def _download_many(self, folder: str, filenames: List[str]) -> Dict[str, Dict]:
+        """Download baseline files concurrently (GitHub I/O only - safe off the main thread)"""
+        def download(filename):
+            try:
+                return filename, _load_from_github(self.github, folder, filename)
+            except FileNotFoundError:
+                return filename, None
+            except Exception as e:
+                print(f"⚠️ Failed to download {filename}: {e}")
+                return filename, None
+        
+        return {
+            filename: data
+            for filename, data in _DOWNLOAD_POOL.map(download, filenames)
+            if data is not None
+        }
+    
     # ====================================================================
     # LIST - From Cache (Fast!)
     # ====================================================================
@@ -206,7 +341,8 @@ class BaselineService:
                     'name': filename,
                     'project': data.get('project'),
                     'created_at': data.get('created_at'),
-                    'failure_count': data.get('failure_count', 0),
+                    # Older payloads may lack the top-level count
+                    'failure_count': data.get('failure_count', len(data.get('failures', []))),
                     'label': data.get('label', 'Auto'),
                     'platform': plat
                 })
@@ -217,6 +353,10 @@ class BaselineService:
         print(f"📋 Listed {len(results)} baselines from cache")
         return results
     
+    def count(self, platform: str) -> int:
+        """Number of cached baselines for a platform - no listing is built"""
+        return len(self._get_cache(platform))
+    
     # ====================================================================
     # DELETE - Both Cache and GitHub
     # ====================================================================
@@ -240,6 +380,8 @@ class BaselineService:
         cache = self._get_cache(platform)
         if filename in cache:
             del cache[filename]
+            self._bump_version()
+            self._bump_revision()
             print(f"✅ Deleted from cache: {filename}")
         
         # 2️⃣ DELETE FROM GITHUB
@@ -249,6 +391,7 @@ class BaselineService:
             success = self.github.delete_baseline(filename, folder=folder)
             
             if success:
+                _forget_file(folder, filename)
                 print(f"✅ Deleted from GitHub: {folder}/{filename}")
             
             return success
@@ -272,41 +415,68 @@ class BaselineService:
         Returns:
             Number of baselines synced
         """
-        synced = 0
+        return self.apply_sync(self.fetch_from_github(platform))
+    
+    def fetch_from_github(self, platform: Optional[str] = None) -> Dict[str, Dict[str, Dict]]:
+        """
+        Download baselines from GitHub without touching the cache.
+        Only does GitHub I/O, so it is safe to run in a background thread.
+        
+        Args:
+            platform: Fetch specific platform, or None for all
+        
+        Returns:
+            {platform: {filename: baseline_data}}
+        """
+        fetched = {}
         
         # Determine which platforms to sync
         platforms = [platform] if platform else ["provar", "automation_api"]
-        
+
+        # One tree request covers every platform folder
+        tree = self.github.list_baseline_tree() if len(platforms) > 1 else None
+
         for plat in platforms:
+            fetched[plat] = {}
             try:
                 folder = f"baselines/{plat}"
-                
+
                 # Get list of files from GitHub
-                files = self.github.list_baselines(folder=folder)
+                if tree is not None:
+                    files = tree.get(plat, [])
+                else:
+                    files = self.github.list_baselines(folder=folder)
                 
                 print(f"🔄 Syncing {len(files)} files from GitHub/{plat}")
                 
-                for file_info in files:
-                    filename = file_info['name']
-                    
-                    try:
-                        # Load from GitHub
-                        content = self.github.load_baseline(filename, folder=folder)
-                        
-                        if content:
-                            data = json.loads(content)
-                            
-                            # Store in cache
-                            self._set_cache(plat, filename, data)
-                            synced += 1
-                    
-                    except Exception as e:
-                        print(f"⚠️ Failed to sync {filename}: {e}")
-                        continue
+                # Download in parallel (shared file cache - contents never change)
+                fetched[plat] = self._download_many(folder, [f['name'] for f in files])
             
             except Exception as e:
                 print(f"⚠️ Failed to sync {plat} baselines: {e}")
         
+        return fetched
+    
+    def apply_sync(self, fetched: Dict[str, Dict[str, Dict]]) -> int:
+        """
+        Store baselines returned by fetch_from_github in the cache
+        
+        Args:
+            fetched: {platform: {filename: baseline_data}}
+        
+        Returns:
+            Number of baselines synced
+        """
+        synced = 0
+        
+        for plat, files in fetched.items():
+            for filename, data in files.items():
+                # Store in cache
+                self._set_cache(plat, filename, data)
+                synced += 1
+        
+        self._bump_revision()
+        
         # Update metadata
         self._update_metadata(
             last_sync=datetime.now().isoformat(),
@@ -374,6 +544,8 @@ class BaselineService:
         """
         if platform:
             st.session_state.baseline_cache[platform] = {}
+            self._bump_version()
+            self._bump_revision()
             print(f"🗑️ Cleared {platform} cache")
         else:
             st.session_state.baseline_cache = {
@@ -382,7 +554,10 @@ class BaselineService:
                 'metadata': {
                     'last_sync': None,
                     'is_synced': False,
-                    'sync_count': 0
+                    'sync_count': 0,
+                    # keep counting up so views built before the clear are not reused
+                    'version': self.get_cache_version() + 1,
+                    'revision': self.get_baseline_revision() + 1
                 }
             }
             print("🗑️ Cleared all caches")
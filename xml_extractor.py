@@ -10,8 +10,49 @@ def extract_failed_tests(xml_file) -> List[Dict]:
     """
 
     xml_file.seek(0)  # 🔑 IMPORTANT for Streamlit re-runs
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
+
+    # --------------------------------------------------
+    # STREAMING PARSE
+    # Testcases are dropped from their parent as soon as
+    # they are read, so large reports never sit in memory
+    # as a full tree.
+    # --------------------------------------------------
+    root = None
+    report_props = None  # first report-level <properties>, as (name, value) pairs
+    failed = []
+    open_elems = []  # ancestors of the current element
+
+    for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            open_elems.append(elem)
+            continue
+
+        open_elems.pop()
+        depth = len(open_elems)
+        tag = elem.tag
+
+        if tag == "testcase":
+            failure = elem.find("failure")
+            if failure is not None:
+                failed.append({
+                    "name": elem.attrib.get("name"),
+                    "testcase_path": elem.attrib.get("classname"),
+                    "error": failure.attrib.get("message", "Execution failed"),
+                    "details": (failure.text or "").strip(),
+                })
+            if open_elems:
+                open_elems[-1].remove(elem)
+        elif tag == "properties" and depth == 1 and report_props is None:
+            report_props = [
+                (prop.attrib.get("name"), prop.attrib.get("value"))
+                for prop in elem.findall("property")
+            ]
+        elif tag in ("system-out", "system-err") and open_elems:
+            open_elems[-1].remove(elem)
+
+    report_props = report_props or []
 
     # --------------------------------------------------
     # EXECUTION TIME (REPORT LEVEL) - MULTIPLE FORMATS
@@ -26,14 +67,12 @@ def extract_failed_tests(xml_file) -> List[Dict]:
     
     # Try to find timestamp in properties
     if not execution_time:
-        props_node = root.find("properties")
-        if props_node is not None:
-            for prop in props_node.findall("property"):
-                prop_name = prop.attrib.get("name", "").lower()
-                if "timestamp" in prop_name or "time" in prop_name:
-                    execution_time = prop.attrib.get("value")
-                    if execution_time:
-                        break
+        for name, value in report_props:
+            prop_name = (name or "").lower()
+            if "timestamp" in prop_name or "time" in prop_name:
+                execution_time = value
+                if execution_time:
+                    break
     
     # Default if not found
     if not execution_time:
@@ -42,33 +81,23 @@ def extract_failed_tests(xml_file) -> List[Dict]:
     # --------------------------------------------------
     # GLOBAL PROPERTIES (report-level)
     # --------------------------------------------------
-    properties = {}
-    props_node = root.find("properties")
-
-    if props_node is not None:
-        for prop in props_node.findall("property"):
-            properties[prop.attrib.get("name")] = prop.attrib.get("value")
+    properties = dict(report_props)
 
     web_browser = properties.get("webBrowserType", "Unknown")
     project_cache_path = properties.get("projectCachePath", "")
 
-    failures = []
-
     # --------------------------------------------------
     # FAILED TESTCASES
     # --------------------------------------------------
-    for testcase in root.findall(".//testcase"):
-        failure = testcase.find("failure")
-        if failure is not None:
-            failures.append({
-                "name": testcase.attrib.get("name"),
-                "testcase_path": testcase.attrib.get("classname"),
-                "error": failure.attrib.get("message", "Execution failed"),
-                "details": (failure.text or "").strip(),
-                "webBrowserType": web_browser,
-                "projectCachePath": project_cache_path,
-                "timestamp": execution_time,
-            })
+    failures = [
+        {
+            **f,
+            "webBrowserType": web_browser,
+            "projectCachePath": project_cache_path,
+            "timestamp": execution_time,
+        }
+        for f in failed
+    ]
 
     # --------------------------------------------------
     # ZERO FAILURE HANDLING 